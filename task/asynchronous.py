@@ -0,0 +1,51 @@
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+_executor = None
+
+
+def get_executor():
+    # Created on first use so TASK_ASYNC_VIEW_THREADS is read once settings are configured
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, "TASK_ASYNC_VIEW_THREADS", 32), thread_name_prefix="task-api"
+        )
+    return _executor
+
+
+def _run_view(view, request, *args, **kwargs):
+    # Same connection handling as a request thread under WSGI
+    close_old_connections()
+    try:
+        response = view(request, *args, **kwargs)
+        # Render here, so serialization does not run on the thread Django keeps for sync code
+        if hasattr(response, "render") and not response.is_rendered:
+            response.render()
+        return response
+    finally:
+        close_old_connections()
+
+
+def as_async_view(view):
+    """
+    Turn a synchronous view into a coroutine view for ASGI deployments.
+
+    Django 3.2 has no async ORM, and DRF views are synchronous. Under ASGI, Django
+    runs every synchronous view on one shared thread, so requests queue behind
+    each other. The view returned here runs the original view, authentication,
+    database access and rendering included, on a pool of TASK_ASYNC_VIEW_THREADS
+    threads, each with its own database connection. The event loop stays free to
+    serve slow clients and the SSE feed meanwhile.
+    """
+
+    @functools.wraps(view)
+    async def async_view(request, *args, **kwargs):
+        run = sync_to_async(_run_view, thread_sensitive=False, executor=get_executor())
+        return await run(view, request, *args, **kwargs)
+
+    return async_view
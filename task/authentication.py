@@ -0,0 +1,133 @@
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, BasicAuthentication, get_authorization_header
+
+TOKEN_SALT = "task.authentication.token"
+
+_verified = OrderedDict()
+_verified_lock = threading.Lock()
+
+
+def _credentials_key(userid, password):
+    # Keyed so that the cache never holds anything an attacker could test passwords against offline
+    message = f"{userid}\0{password}".encode("utf-8")
+    return hmac.new(settings.SECRET_KEY.encode("utf-8"), message, hashlib.sha256).digest()
+
+
+def clear_credentials_cache():
+    with _verified_lock:
+        _verified.clear()
+
+
+class CachedBasicAuthentication(BasicAuthentication):
+    """
+    HTTP Basic authentication that remembers successful verifications in process memory.
+
+    The password hash (PBKDF2 by default) only runs on a miss. A hit costs one
+    primary key lookup of the user row. The entry is only used while the stored
+    password hash still matches, so changing the password, or Django
+    re-hashing it, invalidates it immediately. Entries expire after
+    TASK_AUTH_CACHE_TTL seconds, and at most TASK_AUTH_CACHE_SIZE are kept,
+    least recently used first out.
+    """
+
+    def authenticate_credentials(self, userid, password, request=None):
+        key = _credentials_key(userid, password)
+        now = time.monotonic()
+        with _verified_lock:
+            entry = _verified.get(key)
+            if entry is not None:
+                _verified.move_to_end(key)
+
+        if entry is not None:
+            user_id, password_hash, expires = entry
+            if expires > now:
+                user = get_user_model()._default_manager.filter(pk=user_id).first()
+                if (
+                    user is not None
+                    and user.is_active
+                    and hmac.compare_digest(user.password, password_hash)
+                    and user.get_username() == userid
+                ):
+                    return (user, None)
+            with _verified_lock:
+                _verified.pop(key, None)
+
+        user, auth = super().authenticate_credentials(userid, password, request)
+        ttl = getattr(settings, "TASK_AUTH_CACHE_TTL", 60)
+        max_size = getattr(settings, "TASK_AUTH_CACHE_SIZE", 1024)
+        with _verified_lock:
+            _verified[key] = (user.pk, user.password, now + ttl)
+            while len(_verified) > max_size:
+                _verified.popitem(last=False)
+        return (user, auth)
+
+
+def _token_ttl():
+    return getattr(settings, "TASK_TOKEN_TTL", 900)
+
+
+def issue_token(user):
+    """
+    Return a signed, expiring bearer token for user and its lifetime in seconds.
+
+    The token carries the user's primary key and username, signed with
+    SECRET_KEY and timestamped, so it can be checked without touching the database.
+    """
+    token = signing.dumps({"id": user.pk, "username": user.get_username()}, salt=TOKEN_SALT)
+    return token, _token_ttl()
+
+
+class TokenUser:
+    # Stands in for the user row on token authenticated requests, built from the token alone
+    is_active = True
+    is_authenticated = True
+    is_anonymous = False
+    is_staff = False
+    is_superuser = False
+
+    def __init__(self, pk, username):
+        self.pk = self.id = pk
+        self.username = username
+
+    def __str__(self):
+        return self.username
+
+    def get_username(self):
+        return self.username
+
+
+class BearerTokenAuthentication(BaseAuthentication):
+    """
+    Authenticates "Authorization: Bearer <token>" headers carrying tokens from issue_token.
+
+    Verification is one HMAC and a timestamp check: no password hashing and no
+    user lookup. The flip side of being stateless is that a token stays valid
+    until it expires, even after a password change or deactivation, so
+    TASK_TOKEN_TTL is kept short.
+    """
+
+    keyword = "Bearer"
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise exceptions.AuthenticationFailed("Invalid bearer header.")
+        try:
+            payload = signing.loads(auth[1].decode("ascii"), salt=TOKEN_SALT, max_age=_token_ttl())
+        except (signing.BadSignature, UnicodeDecodeError):
+            raise exceptions.AuthenticationFailed("Invalid or expired token.")
+        return (TokenUser(payload["id"], payload["username"]), auth[1].decode("ascii"))
+
+    def authenticate_header(self, request):
+        return f'{self.keyword} realm="api"'
@@ -0,0 +1,156 @@
+import json
+import logging
+from io import BytesIO
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
+from django.urls import Resolver404, resolve
+from rest_framework import status
+
+from .bulk import BULK_MODES
+from .renderers import encode_json
+
+logger = logging.getLogger(__name__)
+
+BATCH_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+
+# Headers of the batch request that must not leak into its operations
+DROPPED_META = (
+    "CONTENT_TYPE",
+    "CONTENT_LENGTH",
+    "QUERY_STRING",
+    "HTTP_AUTHORIZATION",
+    "HTTP_ACCEPT_ENCODING",
+    "HTTP_IF_MATCH",
+    "HTTP_IF_NONE_MATCH",
+    "HTTP_IF_MODIFIED_SINCE",
+    "HTTP_IF_UNMODIFIED_SINCE",
+)
+
+
+class BatchError(Exception):
+    pass
+
+
+def get_batch_mode(request):
+    # Unlike the bulk endpoints, operations run on their own unless asked otherwise
+    mode = request.query_params.get("mode", "best_effort")
+    if mode not in BULK_MODES:
+        raise BatchError(f"mode must be one of: {', '.join(BULK_MODES)}.")
+    return mode
+
+
+def parse_operations(operations, view_classes, mode="best_effort"):
+    """
+    Check a batch payload and resolve every operation to its view.
+
+    Returns (method, path, query string, body, view, url kwargs) tuples. The
+    whole batch is refused with a BatchError when any operation is malformed or
+    does not address one of view_classes, before anything runs. Atomic batches
+    cannot read: a GET inside the transaction would cache data that a rollback
+    may discard.
+    """
+    max_operations = getattr(settings, "TASK_BATCH_MAX_OPERATIONS", 100)
+    if not isinstance(operations, list) or not operations:
+        raise BatchError("Request body must be a non-empty list.")
+    if len(operations) > max_operations:
+        raise BatchError(f"At most {max_operations} operations can be sent in one request.")
+
+    parsed = []
+    for index, operation in enumerate(operations):
+        if not isinstance(operation, dict) or not set(operation).issubset({"method", "path", "body"}):
+            raise BatchError(f"Operation {index}: must be an object with method, path and body.")
+        method = operation.get("method")
+        if not isinstance(method, str) or method.upper() not in BATCH_METHODS:
+            raise BatchError(f"Operation {index}: method must be one of: {', '.join(BATCH_METHODS)}.")
+        if mode == "atomic" and method.upper() == "GET":
+            raise BatchError(f"Operation {index}: GET cannot be used in atomic mode.")
+        path = operation.get("path")
+        if not isinstance(path, str):
+            raise BatchError(f"Operation {index}: path must be a string.")
+        url = urlsplit(path)
+        try:
+            match = resolve(url.path)
+        except Resolver404:
+            match = None
+        # Under ASGI the routes hold coroutine wrappers; operations call the view itself
+        view = getattr(match.func, "__wrapped__", match.func) if match else None
+        if getattr(view, "view_class", None) not in view_classes:
+            raise BatchError(f"Operation {index}: {url.path} is not a task or tag endpoint.")
+        parsed.append((method.upper(), url.path, url.query, operation.get("body"), view, match.kwargs))
+    return parsed
+
+
+def _build_request(request, method, path, query, body):
+    # A plain request with the batch request's server and client details, always speaking JSON
+    environ = {
+        key: value
+        for key, value in request.META.items()
+        if isinstance(value, str) and key not in DROPPED_META
+    }
+    data = encode_json(body) if body is not None else b""
+    environ.update(
+        {
+            "REQUEST_METHOD": method,
+            "SCRIPT_NAME": "",
+            "PATH_INFO": path,
+            "QUERY_STRING": query,
+            "HTTP_ACCEPT": "application/json",
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": str(len(data)),
+            "wsgi.input": BytesIO(data),
+            "wsgi.url_scheme": request.scheme,
+        }
+    )
+    sub_request = WSGIRequest(environ)
+    # DRF skips the authenticators for requests carrying these, so credentials are checked once per batch
+    sub_request._force_auth_user = request.user
+    sub_request._force_auth_token = request.auth
+    return sub_request
+
+
+def _response_body(response):
+    if hasattr(response, "data"):
+        return response.data
+    content = b"".join(response.streaming_content) if response.streaming else response.content
+    return json.loads(content) if content else None
+
+
+def _run_operation(request, method, path, query, body, view, kwargs):
+    try:
+        response = view(_build_request(request, method, path, query, body), **kwargs)
+        return {"status": response.status_code, "body": _response_body(response)}
+    except Exception:
+        # A broken operation is reported like any other failure instead of losing the whole batch
+        logger.exception("Batch operation %s %s failed", method, path)
+        return {"status": status.HTTP_500_INTERNAL_SERVER_ERROR, "body": {"error": "Internal server error."}}
+
+
+def run_batch(request, operations, mode="best_effort"):
+    """
+    Run parsed operations in order, as the authenticated user of the batch request.
+
+    In "best_effort" mode every operation commits on its own and all of them run.
+    In "atomic" mode they share one transaction: the first operation answering
+    with an error status rolls everything back, and every other operation is
+    reported as 424. Returns the per-operation results and the overall status.
+    """
+    if mode == "best_effort":
+        results = [_run_operation(request, *operation) for operation in operations]
+        if any(result["status"] >= 400 for result in results):
+            return results, status.HTTP_207_MULTI_STATUS
+        return results, status.HTTP_200_OK
+
+    results = []
+    with transaction.atomic():
+        for operation in operations:
+            result = _run_operation(request, *operation)
+            if result["status"] >= 400:
+                transaction.set_rollback(True)
+                failed = [{"status": status.HTTP_424_FAILED_DEPENDENCY} for _ in operations]
+                failed[len(results)] = result
+                return failed, status.HTTP_400_BAD_REQUEST
+            results.append(result)
+    return results, status.HTTP_200_OK
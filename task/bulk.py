@@ -0,0 +1,267 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from rest_framework import serializers, status
+
+from .filters import FilterError, filter_tasks, parse_ids
+from .models import Task
+from .serializers import CustomTagField, TaskSerializer, allowed_fields
+from .tags import resolve_tags
+
+BULK_MODES = ("atomic", "best_effort")
+
+
+class BulkError(Exception):
+    pass
+
+
+class BulkItemErrors(Exception):
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
+def get_bulk_mode(request):
+    mode = request.query_params.get("mode", "atomic")
+    if mode not in BULK_MODES:
+        raise BulkError(f"mode must be one of: {', '.join(BULK_MODES)}.")
+    return mode
+
+
+def check_bulk_size(items):
+    max_items = getattr(settings, "TASK_BULK_MAX_ITEMS", 1000)
+    if not items:
+        raise BulkError("Request body must be a non-empty list.")
+    if len(items) > max_items:
+        raise BulkError(f"At most {max_items} items can be sent in one request.")
+
+
+def _collect_tag_names(items):
+    # Only well-formed names are resolved up front; the serializer reports the rest per item
+    field = CustomTagField()
+    names = []
+    for item in items:
+        tags = item.get("tags") if isinstance(item, dict) else None
+        if isinstance(tags, list):
+            for name in tags:
+                try:
+                    names.append(field.validate_name(name))
+                except serializers.ValidationError:
+                    continue
+    return names
+
+
+def _validate_item(item, context):
+    if not isinstance(item, dict):
+        return None, {"message": "Each item must be an object"}
+    if not set(item.keys()).issubset(allowed_fields):
+        return None, {"message": "Request body contains illegal elements"}
+    serializer = TaskSerializer(data=item, context=context)
+    if not serializer.is_valid():
+        return None, serializer.errors
+    validated_data = dict(serializer.validated_data)
+    tags = validated_data.pop("tags")
+    task = Task(**validated_data)
+    try:
+        task.full_clean()
+    except ValidationError as e:
+        return None, {"error": e.message_dict.get("__all__", [str(e)])[0]}
+    return (task, tags), None
+
+
+def _insert_tasks(tasks):
+    Task.objects.bulk_create(tasks)
+    if not connection.features.can_return_rows_from_bulk_insert:
+        # SQLite in Django 3.2 cannot return the new keys. The transaction holds the
+        # database write lock from the first insert on and ids are AUTOINCREMENT, so
+        # the rows just written are exactly the highest len(tasks) ids.
+        ids = Task.objects.order_by("-id").values_list("id", flat=True)[: len(tasks)]
+        for task, pk in zip(tasks, reversed(list(ids))):
+            task.pk = pk
+            task._state.adding = False
+
+
+def bulk_create_tasks(items, mode="atomic"):
+    """
+    Validate and insert a list of task payloads.
+
+    Tags of the whole payload are resolved in one batch, valid tasks are written
+    with one bulk insert and their tag links with another. In "atomic" mode
+    nothing is written unless every item is valid; in "best_effort" mode valid
+    items are created and invalid ones reported. Returns the per-item results,
+    in request order, and the overall response status.
+    """
+    with transaction.atomic():
+        context = {"resolved_tags": resolve_tags(_collect_tag_names(items))}
+        validated = [_validate_item(item, context) for item in items]
+        failed = any(errors is not None for _, errors in validated)
+
+        if failed and mode == "atomic":
+            transaction.set_rollback(True)
+            results = [
+                {"status": status.HTTP_400_BAD_REQUEST, "errors": errors}
+                if errors is not None
+                else {"status": status.HTTP_424_FAILED_DEPENDENCY}
+                for _, errors in validated
+            ]
+            return results, status.HTTP_400_BAD_REQUEST
+
+        valid = [value for value, errors in validated if errors is None]
+        tasks = [task for task, _ in valid]
+        if tasks:
+            _insert_tasks(tasks)
+            Through = Task.tags.through
+            Through.objects.bulk_create(
+                [Through(task_id=task.pk, tag_id=tag.pk) for task, tags in valid for tag in tags]
+            )
+
+    created = {
+        task.pk: task for task in Task.objects.filter(id__in=[t.pk for t in tasks]).prefetch_related("tags")
+    }
+    results = []
+    for value, errors in validated:
+        if errors is not None:
+            results.append({"status": status.HTTP_400_BAD_REQUEST, "errors": errors})
+        else:
+            data = TaskSerializer(created[value[0].pk]).data
+            results.append({"status": status.HTTP_201_CREATED, "data": data})
+    if not failed:
+        return results, status.HTTP_201_CREATED
+    if not tasks:
+        return results, status.HTTP_400_BAD_REQUEST
+    return results, status.HTTP_207_MULTI_STATUS
+
+
+def _chunk_size():
+    return getattr(settings, "TASK_BULK_CHUNK_SIZE", 500)
+
+
+def _chunks(ids):
+    size = _chunk_size()
+    for start in range(0, len(ids), size):
+        end = start + size
+        yield ids[start:end]
+
+
+def _matching_id_chunks(queryset):
+    # Keyset walk over the primary key so each chunk is a short index range read
+    last = 0
+    while True:
+        ids = list(queryset.filter(id__gt=last).order_by("id").values_list("id", flat=True)[: _chunk_size()])
+        if not ids:
+            return
+        yield ids
+        last = ids[-1]
+
+
+def _get_filtered_queryset(payload):
+    criteria = payload.get("filter")
+    if not isinstance(criteria, dict) or not criteria:
+        raise BulkError("filter must be a non-empty object.")
+    try:
+        queryset = filter_tasks(Task.objects.all(), criteria)
+    except FilterError as e:
+        raise BulkError(str(e))
+    if "ids" in criteria:
+        # ids may be a comma separated string, so count them once parsed
+        check_bulk_size(parse_ids(criteria["ids"]))
+    return queryset
+
+
+def validate_task_fields(fields):
+    """
+    Validate a set of field values to write to many tasks at once.
+
+    Runs the serializer and model validation for just these fields on an
+    unsaved instance, so no rows have to be loaded. Returns the values ready
+    for QuerySet.update() and the errors, one of which is None.
+    """
+    if not isinstance(fields, dict) or not fields:
+        return None, {"message": "fields must be a non-empty object"}
+    if not set(fields).issubset(allowed_fields - {"tags"}):
+        return None, {"message": "Request body contains illegal elements"}
+    serializer = TaskSerializer(data=fields, partial=True)
+    if not serializer.is_valid():
+        return None, serializer.errors
+    values = dict(serializer.validated_data)
+    exclude = [field.name for field in Task._meta.fields if field.name not in values]
+    try:
+        Task(**values).full_clean(exclude=exclude, validate_unique=False)
+    except ValidationError as e:
+        return None, {"error": e.message_dict.get("__all__", [str(e)])[0]}
+    return values, None
+
+
+def _item_id(item):
+    # Integer ids only: parse_ids rejects bools and values SQLite cannot bind, and digit strings are not ids here
+    pk = item.get("id") if isinstance(item, dict) else None
+    if not isinstance(pk, int):
+        return None
+    try:
+        return parse_ids([pk])[0]
+    except FilterError:
+        return None
+
+
+def bulk_update_tasks(payload):
+    """
+    Apply field updates to many tasks with chunked UPDATE ... WHERE id IN statements.
+
+    payload is either a list of {"id": ..., "fields": {...}} items, where items
+    sharing the same field values are written together, or a
+    {"filter": {...}, "fields": {...}} object. Tags cannot be changed in bulk.
+    All chunks commit together. Returns the number of rows updated.
+    """
+    if isinstance(payload, list):
+        check_bulk_size(payload)
+        groups = {}
+        errors = []
+        for index, item in enumerate(payload):
+            if _item_id(item) is None:
+                errors.append({"index": index, "errors": {"message": "Each item needs an integer id"}})
+                continue
+            values, item_errors = validate_task_fields(item.get("fields"))
+            if item_errors is not None:
+                errors.append({"index": index, "errors": item_errors})
+                continue
+            groups.setdefault(tuple(sorted(values.items())), []).append(item["id"])
+        if errors:
+            raise BulkItemErrors(errors)
+        updated = 0
+        with transaction.atomic():
+            for values, ids in groups.items():
+                for chunk in _chunks(list(dict.fromkeys(ids))):
+                    updated += Task.objects.filter(id__in=chunk).update(**dict(values))
+        return updated
+
+    if not isinstance(payload, dict):
+        raise BulkError("Request body must be a list or an object.")
+    queryset = _get_filtered_queryset(payload)
+    values, errors = validate_task_fields(payload.get("fields"))
+    if errors is not None:
+        raise BulkItemErrors([{"index": None, "errors": errors}])
+    updated = 0
+    with transaction.atomic():
+        for chunk in _matching_id_chunks(queryset):
+            updated += Task.objects.filter(id__in=chunk).update(**values)
+    return updated
+
+
+def bulk_delete_tasks(payload):
+    """
+    Delete tasks given as {"ids": [...]} or {"filter": {...}}, chunk by chunk.
+
+    Only primary keys are loaded; tag links go with one DELETE per chunk.
+    All chunks commit together. Returns the number of tasks deleted.
+    """
+    if not isinstance(payload, dict):
+        raise BulkError("Request body must be an object.")
+    if "ids" in payload:
+        payload = {"filter": {"ids": payload["ids"]}}
+    queryset = _get_filtered_queryset(payload)
+    deleted = 0
+    with transaction.atomic():
+        for chunk in _matching_id_chunks(queryset):
+            _, per_model = Task.objects.filter(id__in=chunk).only("id").delete()
+            deleted += per_model.get(Task._meta.label, 0)
+    return deleted
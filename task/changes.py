@@ -0,0 +1,98 @@
+import datetime
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ParseError
+
+from .models import Task, TaskTombstone
+from .pagination import decode_cursor, encode_cursor
+
+# Task.version and TaskTombstone.seq are positions in one change sequence, kept
+# in the "task_changes" row of task_tableversion. Every change to a task row,
+# its tag links or the names of its tags moves the task to the end of the
+# sequence, and every deleted task leaves a tombstone there. The triggers doing
+# so on every write path, bulk ones and Task.delete() alike, are installed by
+# migration 0008_task_changes.
+SEQUENCE = "task_changes"
+
+
+def _retention():
+    return datetime.timedelta(days=getattr(settings, "TASK_TOMBSTONE_RETENTION_DAYS", 30))
+
+
+class CursorExpired(Exception):
+    pass
+
+
+def encode_change_cursor(seq, pk, issued):
+    return encode_cursor([seq, pk, issued.isoformat()])
+
+
+def decode_change_cursor(cursor):
+    """
+    Return the (seq, id) position in a cursor from get_changes.
+
+    Raises CursorExpired when the cursor is older than the tombstone retention
+    window, since deletions after it may already have been pruned.
+    """
+    position = decode_cursor(cursor)
+    if len(position) != 3 or not all(isinstance(value, int) for value in position[:2]):
+        raise ParseError("Invalid cursor.")
+    issued = parse_datetime(position[2]) if isinstance(position[2], str) else None
+    if issued is None:
+        raise ParseError("Invalid cursor.")
+    if issued < timezone.now() - _retention():
+        raise CursorExpired("since is older than the retention window; fetch the full task list again.")
+    return position[0], position[1]
+
+
+def get_changes(position, limit):
+    """
+    The tasks created or changed and the ids of the tasks deleted after position.
+
+    position is a (seq, id) pair, or None for a first sync, which returns every
+    task and no tombstones. Returns up to limit changes in sequence order as
+    (tasks, deleted_ids, next_position, has_more); next_position is the
+    position to continue from, even when there is nothing more for now.
+    """
+    seq, pk = position or (0, 0)
+    after = Q(version__gt=seq) | Q(version=seq, id__gt=pk)
+    tasks = list(Task.objects.filter(after).order_by("version", "id")[: limit + 1])
+    tombstones = []
+    if position is not None:
+        after = Q(seq__gt=seq) | Q(seq=seq, task_id__gt=pk)
+        tombstones = list(TaskTombstone.objects.filter(after).order_by("seq", "task_id")[: limit + 1])
+
+    # Merge both ordered lists into one page
+    changes = sorted(
+        [(task.version, task.id, task) for task in tasks]
+        + [(tombstone.seq, tombstone.task_id, None) for tombstone in tombstones],
+        key=lambda change: change[:2],
+    )
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    if changes:
+        seq, pk = changes[-1][:2]
+    return (
+        [task for _, _, task in changes if task is not None],
+        [task_id for _, task_id, task in changes if task is None],
+        (seq, pk),
+        has_more,
+    )
+
+
+def prune_tombstones(retention=None, batch_size=500):
+    """
+    Delete tombstones older than the retention window, one batch at a time.
+    Returns the number of tombstones deleted.
+    """
+    cutoff = timezone.now() - (retention if retention is not None else _retention())
+    old = TaskTombstone.objects.filter(deleted_at__lt=cutoff)
+    removed = 0
+    while True:
+        ids = list(old.values_list("id", flat=True)[:batch_size])
+        if not ids:
+            return removed
+        removed += TaskTombstone.objects.filter(id__in=ids).delete()[0]
@@ -0,0 +1,262 @@
+import asyncio
+import collections
+import itertools
+import logging
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpRequest
+from rest_framework import exceptions
+
+from .authentication import BearerTokenAuthentication, CachedBasicAuthentication
+from .changes import SEQUENCE, get_changes
+from .fragments import serialize_tasks
+from .models import Tag, TableVersion, Task, TaskTombstone
+from .renderers import encode_json
+
+logger = logging.getLogger(__name__)
+
+EVENTS_PATH = "/api/events/"
+
+AUTHENTICATORS = (CachedBasicAuthentication, BearerTokenAuthentication)
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+class Broadcaster:
+    """
+    Turns database changes into task and tag events and fans them out to subscribers.
+
+    One poller per process reads the task change sequence and the tag table
+    version, a primary key lookup per poll interval however many clients are
+    connected. Only when one moved are the changed rows loaded and serialized,
+    once for every subscriber. Writes from other processes are seen as well.
+    The last TASK_EVENTS_BUFFER_SIZE events are kept for Last-Event-ID resumption.
+    """
+
+    def __init__(self):
+        # Event ids are "<boot>-<n>": ids of another process or an earlier run never match
+        self.boot = uuid.uuid4().hex[:8]
+        self.counter = itertools.count(1)
+        self.buffer = collections.deque(maxlen=_setting("TASK_EVENTS_BUFFER_SIZE", 1000))
+        self.subscribers = set()
+        self.state = None
+        self.poller = None
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=_setting("TASK_EVENTS_QUEUE_SIZE", 100))
+        self.subscribers.add(queue)
+        if self.poller is None or self.poller.done():
+            self.poller = asyncio.ensure_future(self.run())
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+
+    def replay(self, last_event_id):
+        """
+        The buffered events after last_event_id, or None when they cannot all be
+        replayed and the client has to reload its state.
+        """
+        boot, _, number = last_event_id.partition("-")
+        if boot != self.boot or not number.isdigit():
+            return None
+        number = int(number)
+        if self.buffer and self.buffer[0][0] > number + 1:
+            return None
+        return [event for event in self.buffer if event[0] > number]
+
+    def publish(self, name, data):
+        event = (next(self.counter), name, data)
+        self.buffer.append(event)
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # A client that cannot keep up is cut off; it resumes with Last-Event-ID
+                self.unsubscribe(queue)
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(None)
+        return event
+
+    async def run(self):
+        interval = _setting("TASK_EVENTS_POLL_INTERVAL", 1.0)
+        while self.subscribers:
+            try:
+                for name, data in await sync_to_async(self.poll)():
+                    self.publish(name, data)
+            except Exception:
+                logger.exception("Polling for task events failed")
+            await asyncio.sleep(interval)
+        # Nobody listened for a while, so the next run starts afresh and old ids get a reset
+        self.boot = uuid.uuid4().hex[:8]
+        self.buffer.clear()
+        self.state = None
+
+    def _versions(self):
+        versions = dict(
+            TableVersion.objects.filter(name__in=[SEQUENCE, "tag"]).values_list("name", "version")
+        )
+        return versions.get(SEQUENCE, 0), versions.get("tag", 0)
+
+    def poll(self):
+        """
+        Return the (name, data) events for the changes since the previous call.
+        The first call only records where things stand.
+        """
+        sequence, tag_version = self._versions()
+        if self.state is None:
+            # Ids only grow, so tasks above the highest id seen so far are new ones
+            last_task = Task.objects.order_by("-id").values_list("id", flat=True).first() or 0
+            # Start after every change already at the current sequence number, deletions included
+            last_deleted = (
+                TaskTombstone.objects.filter(seq=sequence)
+                .order_by("-task_id")
+                .values_list("task_id", flat=True)
+            ).first() or 0
+            self.state = {
+                "position": (sequence, max(last_task, last_deleted)),
+                "last_task": last_task,
+                "tag_version": tag_version,
+                "tags": dict(Tag.objects.values_list("id", "name")),
+            }
+            return []
+
+        events = []
+        state = self.state
+        if sequence != state["position"][0]:
+            has_more = True
+            while has_more:
+                tasks, deleted, state["position"], has_more = get_changes(state["position"], 500)
+                for task, data in zip(tasks, serialize_tasks(tasks)):
+                    created = task.id > state["last_task"]
+                    events.append(("task.created" if created else "task.updated", data))
+                    state["last_task"] = max(state["last_task"], task.id)
+                events.extend(("task.deleted", {"id": task_id}) for task_id in deleted)
+        if tag_version != state["tag_version"]:
+            tags = dict(Tag.objects.values_list("id", "name"))
+            for pk, name in tags.items():
+                if pk not in state["tags"]:
+                    events.append(("tag.created", {"id": pk, "name": name}))
+                elif state["tags"][pk] != name:
+                    events.append(("tag.updated", {"id": pk, "name": name}))
+            events.extend(("tag.deleted", {"id": pk}) for pk in state["tags"] if pk not in tags)
+            state["tags"], state["tag_version"] = tags, tag_version
+        return events
+
+
+broadcaster = Broadcaster()
+
+
+def format_event(event):
+    number, name, data = event
+    return f"id: {broadcaster.boot}-{number}\nevent: {name}\ndata: ".encode() + encode_json(data) + b"\n\n"
+
+
+def authenticate(headers):
+    # The API's own authenticators, run against a bare request carrying the headers
+    request = HttpRequest()
+    authorization = headers.get(b"authorization")
+    if authorization:
+        request.META["HTTP_AUTHORIZATION"] = authorization.decode("latin-1")
+    for authenticator in AUTHENTICATORS:
+        try:
+            result = authenticator().authenticate(request)
+        except exceptions.AuthenticationFailed:
+            return None
+        if result is not None:
+            return result[0]
+    return None
+
+
+async def _send_error(send, status, message, headers=()):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", b"application/json"), *headers],
+        }
+    )
+    await send({"type": "http.response.body", "body": encode_json({"error": message})})
+
+
+async def _wait_for_disconnect(receive):
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+async def events_application(scope, receive, send):
+    """
+    ASGI application streaming task and tag events as Server-Sent Events.
+
+    Every event carries the changed task's full representation, or the tag's id
+    and name, or just the id for deletions. A client reconnecting with
+    Last-Event-ID gets the events it missed, or a "reset" event when they are
+    no longer buffered and it has to reload the lists.
+    """
+    if scope["method"] != "GET":
+        await _send_error(send, 405, "Method not allowed.", [(b"allow", b"GET")])
+        return
+    headers = dict(scope["headers"])
+    user = await sync_to_async(authenticate)(headers)
+    if user is None:
+        challenge = CachedBasicAuthentication().authenticate_header(None).encode()
+        await _send_error(
+            send,
+            401,
+            "Authentication credentials were not provided or are invalid.",
+            [(b"www-authenticate", challenge)],
+        )
+        return
+
+    queue = broadcaster.subscribe()
+    try:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/event-stream"),
+                    (b"cache-control", b"no-cache"),
+                    (b"x-accel-buffering", b"no"),
+                ],
+            }
+        )
+        last_event_id = headers.get(b"last-event-id", b"").decode("latin-1")
+        if last_event_id:
+            missed = broadcaster.replay(last_event_id)
+            if missed is None:
+                # Numbered like the newest event, so resuming from it skips everything the reload covers
+                missed = [(broadcaster.buffer[-1][0] if broadcaster.buffer else 0, "reset", {})]
+            for event in missed:
+                await send({"type": "http.response.body", "body": format_event(event), "more_body": True})
+
+        disconnect = asyncio.ensure_future(_wait_for_disconnect(receive))
+        keepalive = _setting("TASK_EVENTS_KEEPALIVE", 15)
+        try:
+            while True:
+                event = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait(
+                    {event, disconnect}, timeout=keepalive, return_when=asyncio.FIRST_COMPLETED
+                )
+                if disconnect in done:
+                    event.cancel()
+                    break
+                if event not in done:
+                    event.cancel()
+                    await send({"type": "http.response.body", "body": b": keep-alive\n\n", "more_body": True})
+                    continue
+                if event.result() is None:
+                    break
+                await send(
+                    {"type": "http.response.body", "body": format_event(event.result()), "more_body": True}
+                )
+        finally:
+            disconnect.cancel()
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        broadcaster.unsubscribe(queue)
@@ -0,0 +1,42 @@
+from rest_framework.exceptions import ParseError
+
+from .serializers import TaskSerializer
+
+# Loaded even when not asked for: cursors and streams position the next page on them
+KEY_COLUMNS = ("id", "timestamp")
+
+
+# Named field lists for ?view=
+VIEWS = {"summary": ("id", "title", "status", "due_date")}
+
+
+def get_requested_fields(request):
+    """
+    The task fields named by ?fields=, in request order, or by a ?view= preset,
+    or None for all of them.
+    """
+    value = request.query_params.get("fields")
+    view = request.query_params.get("view")
+    if view is not None:
+        if value is not None:
+            raise ParseError("fields cannot be combined with view.")
+        if view not in VIEWS:
+            raise ParseError(f"view must be one of: {', '.join(sorted(VIEWS))}.")
+        return list(VIEWS[view])
+    if value is None:
+        return None
+    fields = list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    valid = TaskSerializer().fields.keys()
+    if not fields or not set(fields).issubset(valid):
+        raise ParseError(f"fields must be a comma separated list of: {', '.join(sorted(valid))}.")
+    return fields
+
+
+def restrict_queryset(queryset, fields):
+    # Only the requested columns are selected, and the tags only loaded when asked for
+    if fields is None:
+        return queryset.prefetch_related("tags")
+    queryset = queryset.only(*KEY_COLUMNS, *(name for name in fields if name != "tags"))
+    if "tags" in fields:
+        queryset = queryset.prefetch_related("tags")
+    return queryset
@@ -0,0 +1,95 @@
+import re
+
+from django.db.models import Count
+from django.utils.dateparse import parse_date
+
+from .models import Task
+from .tags import normalize_tag_name
+
+FILTER_PARAMS = ("ids", "status", "due_before", "due_after", "tags", "tags_match")
+
+# Filters the task list accepts in its query string
+LIST_FILTER_PARAMS = ("status", "due_before", "due_after", "tags", "tags_match")
+
+# Ids are signed 64-bit integers; SQLite cannot bind anything larger
+MAX_ID = 2**63 - 1
+
+
+class FilterError(ValueError):
+    pass
+
+
+def _as_list(name, value):
+    # Query strings carry comma separated values, JSON bodies may send lists
+    if isinstance(value, str):
+        return [item for item in value.split(",") if item]
+    if isinstance(value, list):
+        return value
+    raise FilterError(f"{name} must be a list or a comma separated string.")
+
+
+def _as_id(value):
+    # Integers and strings of digits only; bools and floats are not ids
+    if isinstance(value, str) and re.fullmatch(r"\s*-?[0-9]+\s*", value):
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise FilterError("ids must be integers.")
+    if not -MAX_ID - 1 <= value <= MAX_ID:
+        raise FilterError("ids must be 64-bit integers.")
+    return value
+
+
+def parse_ids(value):
+    return [_as_id(pk) for pk in _as_list("ids", value)]
+
+
+def _as_date(name, value):
+    parsed = parse_date(value) if isinstance(value, str) else None
+    if parsed is None:
+        raise FilterError(f"{name} must be a date in YYYY-MM-DD format.")
+    return parsed
+
+
+def filter_tasks(queryset, params, allowed=FILTER_PARAMS):
+    """
+    Narrow a Task queryset by the filter parameters in params, a dict or a QueryDict.
+
+    due_before and due_after are inclusive bounds on due_date. tags keeps tasks
+    carrying any of the named tags, or all of them with tags_match=all.
+    """
+    unknown = set(params) - set(allowed)
+    if unknown:
+        raise FilterError(f"Unknown filter parameter(s): {', '.join(sorted(unknown))}.")
+
+    if "ids" in params:
+        queryset = queryset.filter(id__in=parse_ids(params.get("ids")))
+    if "status" in params:
+        statuses = _as_list("status", params.get("status"))
+        valid = {choice for choice, _ in Task.STATUS_CHOICES}
+        if not statuses or not set(statuses).issubset(valid):
+            raise FilterError(f"status must be one of: {', '.join(sorted(valid))}.")
+        queryset = queryset.filter(status__in=statuses)
+    if "due_before" in params:
+        queryset = queryset.filter(due_date__lte=_as_date("due_before", params.get("due_before")))
+    if "due_after" in params:
+        queryset = queryset.filter(due_date__gte=_as_date("due_after", params.get("due_after")))
+    if "tags" in params:
+        queryset = _filter_tags(
+            queryset, _as_list("tags", params.get("tags")), params.get("tags_match", "any")
+        )
+    elif "tags_match" in params:
+        raise FilterError("tags_match requires tags.")
+    return queryset
+
+
+def _filter_tags(queryset, names, match):
+    if match not in ("any", "all"):
+        raise FilterError("tags_match must be one of: all, any.")
+    if not names or not all(isinstance(name, str) for name in names):
+        raise FilterError("tags must be a list of tag names.")
+    # Runs on the (tag_id, task_id) index of the through table, never touching task rows
+    links = Task.tags.through.objects.filter(tag__name__in=names).values("task_id")
+    if match == "all":
+        wanted = len({normalize_tag_name(name) for name in names})
+        links = links.annotate(matched=Count("tag_id")).filter(matched=wanted).values("task_id")
+    return queryset.filter(id__in=links)
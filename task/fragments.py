@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+
+from .caching import get_response_cache
+from .serializers import TaskSerializer
+
+# Bump whenever TaskSerializer output changes so fragments of the old shape are never served
+FRAGMENT_SCHEMA = 1
+
+
+def _fragment_key(task):
+    # The creation timestamp keeps keys apart should ids ever be reused, e.g. after a restore
+    return f"task-fragment:{FRAGMENT_SCHEMA}:{task.pk}:{task.timestamp.timestamp()}:{task.version}"
+
+
+def serialize_tasks(tasks):
+    """
+    TaskSerializer(tasks, many=True).data, reusing cached representations of unchanged rows.
+
+    Fragments are read with one get_many. Only the tasks without a fragment for
+    their current version have their tags loaded, with one prefetch query, and
+    are serialized; their fragments are written back with one set_many once the
+    surrounding transaction, if any, commits. A rollback also rolls back the
+    change sequence, so the next real write reuses the version numbers of the
+    discarded rows and their fragments must never be stored.
+    """
+    cache = get_response_cache()
+    keys = [_fragment_key(task) for task in tasks]
+    fragments = cache.get_many(keys)
+    missing = [task for task, key in zip(tasks, keys) if key not in fragments]
+    if missing:
+        prefetch_related_objects(missing, "tags")
+        fresh = {
+            _fragment_key(task): data for task, data in zip(missing, TaskSerializer(missing, many=True).data)
+        }
+        timeout = getattr(settings, "TASK_FRAGMENT_CACHE_TIMEOUT", 3600)
+        transaction.on_commit(lambda: cache.set_many(fresh, timeout))
+        fragments.update(fresh)
+    return [fragments[key] for key in keys]
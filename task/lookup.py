@@ -0,0 +1,48 @@
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.response import Response
+
+from .fieldsets import get_requested_fields, restrict_queryset
+from .filters import FilterError, parse_ids
+from .fragments import serialize_tasks
+from .models import Task
+from .serializers import TaskSerializer
+
+
+def lookup_tasks(value, fields=None):
+    """
+    The tasks with the ids in value, a list or a comma separated string.
+
+    All of them are read with one id IN (...) query. Full representations come
+    from serialize_tasks, which loads the tags of the rows it has no cached
+    fragment of with one prefetch query; ?fields= responses prefetch the tags
+    when they are asked for. Returns the serialized tasks in request order,
+    duplicates dropped, and the ids that matched no task.
+    """
+    ids = list(dict.fromkeys(parse_ids(value)))
+    # SQLite builds older than 3.32 refuse statements with more than 999 parameters
+    max_ids = getattr(settings, "TASK_LOOKUP_MAX_IDS", 500)
+    if not ids:
+        raise FilterError("ids must not be empty.")
+    if len(ids) > max_ids:
+        raise FilterError(f"At most {max_ids} ids can be looked up in one request.")
+
+    queryset = Task.objects.filter(id__in=ids)
+    if fields is not None:
+        queryset = restrict_queryset(queryset, fields)
+    found = {task.id: task for task in queryset}
+    tasks = [found[pk] for pk in ids if pk in found]
+    if fields is None:
+        results = serialize_tasks(tasks)
+    else:
+        results = TaskSerializer(tasks, many=True, fields=fields).data
+    return results, [pk for pk in ids if pk not in found]
+
+
+def lookup_tasks_response(request, value):
+    try:
+        results, missing = lookup_tasks(value, get_requested_fields(request))
+    except (FilterError, ParseError) as e:
+        return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({"results": results, "missing": missing}, status=status.HTTP_200_OK)
@@ -0,0 +1,76 @@
+import datetime
+import io
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from task.renderers import FastJSONParser, FastJSONRenderer, orjson
+
+
+def make_payload(size):
+    # Shaped like TaskSerializer output, dates as raw objects like in views that skip the serializer
+    start = datetime.datetime(2023, 6, 1, tzinfo=datetime.timezone.utc)
+    return [
+        {
+            "id": i,
+            "timestamp": start + datetime.timedelta(seconds=i, microseconds=i % 1000),
+            "title": f"Task {i}",
+            "description": "Sample description " * 4,
+            "due_date": (start + datetime.timedelta(days=i % 365)).date(),
+            "tags": [f"Tag {i % 7}", f"Tag {i % 11}"],
+            "status": "OPEN",
+        }
+        for i in range(size)
+    ]
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+class Command(BaseCommand):
+    help = "Compare DRF's stdlib JSON renderer and parser with the orjson backed ones on task lists."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Runs per measurement, the best one counts."
+        )
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stderr.write("orjson is not installed; the fast renderer falls back to the stdlib.")
+        self.stdout.write(f"{'tasks':>8} {'step':<7} {'stdlib ms':>10} {'fast ms':>10} {'speedup':>8}")
+        for size in options["sizes"]:
+            payload = make_payload(size)
+            body = JSONRenderer().render(payload)
+            for step, slow, fast in [
+                (
+                    "render",
+                    lambda: JSONRenderer().render(payload),
+                    lambda: FastJSONRenderer().render(payload),
+                ),
+                (
+                    "parse",
+                    lambda: JSONParser().parse(io.BytesIO(body)),
+                    lambda: FastJSONParser().parse(io.BytesIO(body)),
+                ),
+            ]:
+                slow_time = best_of(options["repeat"], slow)
+                fast_time = best_of(options["repeat"], fast)
+                self.stdout.write(
+                    f"{size:>8} {step:<7} {slow_time * 1000:>10.1f} {fast_time * 1000:>10.1f}"
+                    f" {slow_time / fast_time:>7.1f}x"
+                )
+        # Both renderers must agree on what they produce
+        sample = make_payload(10)
+        if json.loads(JSONRenderer().render(sample)) != json.loads(FastJSONRenderer().render(sample)):
+            self.stderr.write("Warning: renderer outputs differ.")
@@ -0,0 +1,90 @@
+import base64
+import socket
+import statistics
+import threading
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+def slow_client(host, port, path, authorization, delay, stop):
+    # Sends a valid request one byte at a time, the way a client on a poor connection would
+    request = (
+        f"GET {path} HTTP/1.1\r\nHost: {host}\r\nAuthorization: {authorization}\r\n"
+        "Connection: close\r\n\r\n"
+    ).encode()
+    try:
+        with socket.create_connection((host, port), timeout=30) as sock:
+            for byte in request:
+                if stop.is_set():
+                    return
+                sock.sendall(bytes([byte]))
+                time.sleep(delay)
+            while sock.recv(65536):
+                pass
+    except OSError:
+        pass
+
+
+def probe(url, authorization):
+    request = urllib.request.Request(url, headers={"Authorization": authorization})
+    started = time.perf_counter()
+    with urllib.request.urlopen(request, timeout=60) as response:
+        response.read()
+    return time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the latency of API requests against a running server while slow clients hold "
+        "connections open, to compare WSGI and ASGI deployments."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("url", help="Endpoint to probe, e.g. http://127.0.0.1:8000/api/tags/")
+        parser.add_argument("--username", required=True)
+        parser.add_argument("--password", required=True)
+        parser.add_argument("--slow-clients", type=int, default=50)
+        parser.add_argument(
+            "--delay", type=float, default=0.2, help="Seconds between the bytes a slow client sends."
+        )
+        parser.add_argument("--probes", type=int, default=20)
+
+    def handle(self, *args, **options):
+        parts = urlsplit(options["url"])
+        if parts.scheme != "http" or not parts.hostname:
+            raise CommandError("url must be an http:// URL.")
+        credentials = f"{options['username']}:{options['password']}".encode()
+        authorization = "Basic " + base64.b64encode(credentials).decode()
+        path = parts.path or "/"
+
+        baseline = [probe(options["url"], authorization) for _ in range(options["probes"])]
+
+        stop = threading.Event()
+        clients = [
+            threading.Thread(
+                target=slow_client,
+                args=(parts.hostname, parts.port or 80, path, authorization, options["delay"], stop),
+                daemon=True,
+            )
+            for _ in range(options["slow_clients"])
+        ]
+        for client in clients:
+            client.start()
+        # Let every slow client get its connection in first
+        time.sleep(1)
+        try:
+            loaded = [probe(options["url"], authorization) for _ in range(options["probes"])]
+        finally:
+            stop.set()
+
+        self.stdout.write(f"{'':<22} {'median ms':>10} {'max ms':>10}")
+        for label, timings in [
+            ("no slow clients", baseline),
+            (f"{options['slow_clients']} slow clients", loaded),
+        ]:
+            self.stdout.write(
+                f"{label:<22} {statistics.median(timings) * 1000:>10.1f} {max(timings) * 1000:>10.1f}"
+            )
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from task.models import Tag, Task
+from task.tags import merge_duplicate_tags, prune_orphan_tags
+
+
+class Command(BaseCommand):
+    help = "Merge tags whose names differ only by case and optionally delete tags no task uses."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="Duplicate groups or orphan tags handled per transaction.",
+        )
+        parser.add_argument(
+            "--prune-orphans",
+            action="store_true",
+            help="Also delete tags that are not attached to any task.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        merged = merge_duplicate_tags(Tag, Task.tags.through, batch_size=batch_size)
+        self.stdout.write(f"Merged {merged} duplicate tag(s).")
+        if options["prune_orphans"]:
+            pruned = prune_orphan_tags(Tag, Task.tags.through, batch_size=batch_size)
+            self.stdout.write(f"Deleted {pruned} orphan tag(s).")
@@ -0,0 +1,23 @@
+import datetime
+
+from django.core.management.base import BaseCommand
+
+from task.changes import prune_tombstones
+
+
+class Command(BaseCommand):
+    help = "Delete tombstones of deleted tasks that are older than the retention window."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=None,
+            help="Retention window in days, TASK_TOMBSTONE_RETENTION_DAYS by default.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500, help="Tombstones deleted per statement.")
+
+    def handle(self, *args, **options):
+        retention = datetime.timedelta(days=options["days"]) if options["days"] is not None else None
+        pruned = prune_tombstones(retention, batch_size=options["batch_size"])
+        self.stdout.write(f"Deleted {pruned} tombstone(s).")
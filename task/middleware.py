@@ -0,0 +1,133 @@
+import gzip
+import zlib
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from .asynchronous import get_executor
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# Preferred first when the client accepts several with the same q-value
+ENCODINGS = tuple(
+    name for name, module in (("zstd", zstandard), ("br", brotli), ("gzip", gzip)) if module is not None
+)
+
+DEFAULT_LEVELS = {"zstd": 3, "br": 4, "gzip": 6}
+
+
+def choose_encoding(accept_encoding):
+    """
+    Pick the content coding for an Accept-Encoding header value, or None.
+
+    The client's q-values decide; ties go to the order of ENCODINGS. Codings
+    listed with q=0 are never used, "*" covers the ones not listed.
+    """
+    qualities = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name] = quality
+    wildcard = qualities.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for name in ENCODINGS:
+        quality = qualities.get(name, qualities.get("x-gzip", wildcard) if name == "gzip" else wildcard)
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+def compress(encoding, data, level):
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def compress_stream(encoding, chunks, level):
+    # Every chunk is flushed so clients can decode it as soon as it arrives
+    if encoding == "zstd":
+        compressor = zstandard.ZstdCompressor(level=level).compressobj()
+        for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+        yield compressor.flush()
+    elif encoding == "br":
+        compressor = brotli.Compressor(quality=level)
+        for chunk in chunks:
+            yield compressor.process(chunk) + compressor.flush()
+        yield compressor.finish()
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress responses with zstd, brotli or gzip, as negotiated from Accept-Encoding.
+
+    Bodies under TASK_COMPRESSION_MIN_SIZE bytes are sent as they are, as are
+    bodies that would not get smaller. Streaming responses are compressed chunk
+    by chunk. TASK_COMPRESSION_LEVELS sets the level of each coding. In async
+    chains the compression runs on the view thread pool.
+    """
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        # MiddlewareMixin would compress on Django's one shared sync thread, serializing every request on it
+        process_response = sync_to_async(
+            self.process_response, thread_sensitive=False, executor=get_executor()
+        )
+        return await process_response(request, response)
+
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding"):
+            return response
+        min_size = getattr(settings, "TASK_COMPRESSION_MIN_SIZE", 1024)
+        if not response.streaming and len(response.content) < min_size:
+            return response
+
+        # The response depends on Accept-Encoding whether or not this request gets compression
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+        level = {**DEFAULT_LEVELS, **getattr(settings, "TASK_COMPRESSION_LEVELS", {})}[encoding]
+
+        if response.streaming:
+            response.streaming_content = compress_stream(encoding, response.streaming_content, level)
+            del response["Content-Length"]
+        else:
+            compressed = compress(encoding, response.content, level)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response["Content-Length"] = str(len(compressed))
+
+        # The bytes differ per coding, so a strong validator would be wrong for them
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = encoding
+        return response
@@ -0,0 +1,16 @@
+# Generated by Django 3.2.19 on 2026-10-18 18:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["timestamp", "id"], name="task_timestamp_id_idx"),
+        ),
+    ]
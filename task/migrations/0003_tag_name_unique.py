@@ -0,0 +1,51 @@
+# Generated by Django 3.2.19 on 2026-10-18 18:59
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+from django.db.models.functions import Lower
+
+
+def merge_duplicates(apps, schema_editor):
+    # Large tables should be cleaned with `manage.py dedupe_tags` beforehand,
+    # which leaves nothing for this step to do. A frozen copy of
+    # task.tags.merge_duplicate_tags, so later changes to it cannot alter this migration.
+    Tag = apps.get_model("task", "Tag")
+    Through = apps.get_model("task", "Task").tags.through
+    groups = (
+        Tag.objects.annotate(key=Lower("name"))
+        .values("key")
+        .annotate(count=Count("id"), keep=Min("id"))
+        .filter(count__gt=1)
+    )
+    keep = {group["key"]: group["keep"] for group in groups}
+    if not keep:
+        return
+    duplicates = {
+        tag_id: keep[key]
+        for tag_id, key in Tag.objects.annotate(key=Lower("name"))
+        .filter(key__in=list(keep))
+        .values_list("id", "key")
+        if tag_id != keep[key]
+    }
+    links = Through.objects.filter(tag_id__in=list(duplicates)).values_list("task_id", "tag_id")
+    Through.objects.bulk_create(
+        [Through(task_id=task_id, tag_id=duplicates[tag_id]) for task_id, tag_id in links],
+        ignore_conflicts=True,
+    )
+    Through.objects.filter(tag_id__in=list(duplicates)).delete()
+    Tag.objects.filter(id__in=list(duplicates)).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0002_task_timestamp_id_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="tag",
+            name="name",
+            field=models.CharField(db_collation="NOCASE", max_length=100, unique=True),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.19 on 2026-10-18 19:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0003_tag_name_unique"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["status", "timestamp", "id"], name="task_status_timestamp_id_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["due_date", "status"], name="task_due_date_status_idx"),
+        ),
+        # Covering index for tag filters on the auto-created task/tag through table
+        migrations.RunSQL(
+            'CREATE INDEX "task_task_tags_tag_id_task_id_idx" ON "task_task_tags" ("tag_id", "task_id");',
+            'DROP INDEX "task_task_tags_tag_id_task_id_idx";',
+        ),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations
+
+# Frozen copies of the SQL in task/search.py as of this migration; later edits
+# to that module must not change what this migration does.
+CREATE_FTS_TABLE = (
+    'CREATE VIRTUAL TABLE "task_task_fts" USING fts5('
+    "title, description, content='task_task', content_rowid='id', tokenize='unicode61 remove_diacritics 2'"
+    ");",
+    'INSERT INTO "task_task_fts"("task_task_fts") VALUES (\'rebuild\');',
+)
+
+DROP_FTS_TABLE = ('DROP TABLE IF EXISTS "task_task_fts";',)
+
+CREATE_FTS_TRIGGERS = (
+    """CREATE TRIGGER "task_task_fts_insert" AFTER INSERT ON "task_task" BEGIN
+        INSERT INTO "task_task_fts"(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END;""",
+    """CREATE TRIGGER "task_task_fts_delete" AFTER DELETE ON "task_task" BEGIN
+        INSERT INTO "task_task_fts"("task_task_fts", rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END;""",
+    """CREATE TRIGGER "task_task_fts_update" AFTER UPDATE OF title, description ON "task_task" BEGIN
+        INSERT INTO "task_task_fts"("task_task_fts", rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO "task_task_fts"(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END;""",
+)
+
+DROP_FTS_TRIGGERS = (
+    'DROP TRIGGER IF EXISTS "task_task_fts_insert";',
+    'DROP TRIGGER IF EXISTS "task_task_fts_delete";',
+    'DROP TRIGGER IF EXISTS "task_task_fts_update";',
+)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0004_task_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_FTS_TABLE, DROP_FTS_TABLE),
+        migrations.RunSQL(CREATE_FTS_TRIGGERS, DROP_FTS_TRIGGERS),
+    ]
@@ -0,0 +1,90 @@
+# Generated by Django 3.2.19 on 2026-10-18 19:10
+
+from django.db import migrations, models
+import django.utils.timezone
+
+# Frozen copies of the SQL in task/versioning.py as of this migration; later
+# edits to that module must not change what this migration does.
+CREATE_VERSION_TRIGGERS = (
+    """CREATE TRIGGER "task_tableversion_task_task_insert" AFTER INSERT ON "task_task" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('task');
+    END;""",
+    """CREATE TRIGGER "task_tableversion_task_task_update" AFTER UPDATE ON "task_task" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('task');
+    END;""",
+    """CREATE TRIGGER "task_tableversion_task_task_delete" AFTER DELETE ON "task_task" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('task');
+    END;""",
+    """CREATE TRIGGER "task_tableversion_task_task_tags_insert" AFTER INSERT ON "task_task_tags" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('task');
+    END;""",
+    """CREATE TRIGGER "task_tableversion_task_task_tags_update" AFTER UPDATE ON "task_task_tags" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('task');
+    END;""",
+    """CREATE TRIGGER "task_tableversion_task_task_tags_delete" AFTER DELETE ON "task_task_tags" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('task');
+    END;""",
+    """CREATE TRIGGER "task_tableversion_task_tag_insert" AFTER INSERT ON "task_tag" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('tag');
+    END;""",
+    """CREATE TRIGGER "task_tableversion_task_tag_update" AFTER UPDATE ON "task_tag" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('task', 'tag');
+    END;""",
+    """CREATE TRIGGER "task_tableversion_task_tag_delete" AFTER DELETE ON "task_tag" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('task', 'tag');
+    END;""",
+)
+
+DROP_VERSION_TRIGGERS = (
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_task_insert";',
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_task_update";',
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_task_delete";',
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_task_tags_insert";',
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_task_tags_update";',
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_task_tags_delete";',
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_tag_insert";',
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_tag_update";',
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_tag_delete";',
+)
+
+
+def create_versions(apps, schema_editor):
+    TableVersion = apps.get_model("task", "TableVersion")
+    TableVersion.objects.bulk_create([TableVersion(name="task"), TableVersion(name="tag")])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0005_task_fts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TableVersion",
+            fields=[
+                ("name", models.CharField(max_length=50, primary_key=True, serialize=False)),
+                ("version", models.BigIntegerField(default=0)),
+                ("modified", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.RunPython(create_versions, migrations.RunPython.noop),
+        migrations.RunSQL(CREATE_VERSION_TRIGGERS, DROP_VERSION_TRIGGERS),
+    ]
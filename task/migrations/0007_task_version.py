@@ -0,0 +1,89 @@
+# Generated by Django 3.2.19 on 2026-10-18 19:19
+
+from django.db import migrations, models
+
+# Frozen copies of the SQL in task/search.py, task/versioning.py and
+# task/fragments.py as of this migration; later edits to those modules must not
+# change what this migration does.
+
+# Adding a column makes SQLite rebuild task_task, which drops every trigger on it
+TASK_TRIGGERS = (
+    """CREATE TRIGGER "task_task_fts_insert" AFTER INSERT ON "task_task" BEGIN
+        INSERT INTO "task_task_fts"(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END;""",
+    """CREATE TRIGGER "task_task_fts_delete" AFTER DELETE ON "task_task" BEGIN
+        INSERT INTO "task_task_fts"("task_task_fts", rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END;""",
+    """CREATE TRIGGER "task_task_fts_update" AFTER UPDATE OF title, description ON "task_task" BEGIN
+        INSERT INTO "task_task_fts"("task_task_fts", rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO "task_task_fts"(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END;""",
+    """CREATE TRIGGER "task_tableversion_task_task_insert" AFTER INSERT ON "task_task" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('task');
+    END;""",
+    """CREATE TRIGGER "task_tableversion_task_task_update" AFTER UPDATE ON "task_task" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('task');
+    END;""",
+    """CREATE TRIGGER "task_tableversion_task_task_delete" AFTER DELETE ON "task_task" BEGIN
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now')
+        WHERE "name" IN ('task');
+    END;""",
+)
+
+DROP_TASK_TRIGGERS = (
+    'DROP TRIGGER IF EXISTS "task_task_fts_insert";',
+    'DROP TRIGGER IF EXISTS "task_task_fts_delete";',
+    'DROP TRIGGER IF EXISTS "task_task_fts_update";',
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_task_insert";',
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_task_update";',
+    'DROP TRIGGER IF EXISTS "task_tableversion_task_task_delete";',
+)
+
+# Per-row change counters read by the task fragment cache
+CREATE_ROW_VERSION_TRIGGERS = (
+    """CREATE TRIGGER "task_task_version_update" AFTER UPDATE ON "task_task"
+    WHEN new.version = old.version BEGIN
+        UPDATE "task_task" SET "version" = old.version + 1 WHERE "id" = new.id;
+    END;""",
+    """CREATE TRIGGER "task_task_version_tags_insert" AFTER INSERT ON "task_task_tags" BEGIN
+        UPDATE "task_task" SET "version" = "version" + 1 WHERE "id" = new.task_id;
+    END;""",
+    """CREATE TRIGGER "task_task_version_tags_delete" AFTER DELETE ON "task_task_tags" BEGIN
+        UPDATE "task_task" SET "version" = "version" + 1 WHERE "id" = old.task_id;
+    END;""",
+    """CREATE TRIGGER "task_task_version_tag_update" AFTER UPDATE OF name ON "task_tag" BEGIN
+        UPDATE "task_task" SET "version" = "version" + 1
+        WHERE "id" IN (SELECT "task_id" FROM "task_task_tags" WHERE "tag_id" = new.id);
+    END;""",
+)
+
+DROP_ROW_VERSION_TRIGGERS = (
+    'DROP TRIGGER IF EXISTS "task_task_version_update";',
+    'DROP TRIGGER IF EXISTS "task_task_version_tags_insert";',
+    'DROP TRIGGER IF EXISTS "task_task_version_tags_delete";',
+    'DROP TRIGGER IF EXISTS "task_task_version_tag_update";',
+)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0006_tableversion"),
+    ]
+
+    operations = [
+        migrations.RunSQL(DROP_TASK_TRIGGERS, TASK_TRIGGERS),
+        migrations.AddField(
+            model_name="task",
+            name="version",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(TASK_TRIGGERS, DROP_TASK_TRIGGERS),
+        migrations.RunSQL(CREATE_ROW_VERSION_TRIGGERS, DROP_ROW_VERSION_TRIGGERS),
+    ]
@@ -0,0 +1,142 @@
+# Generated by Django 3.2.19 on 2026-10-18 19:28
+
+from django.db import migrations, models
+import django.utils.timezone
+
+# Frozen copies of the SQL in task/changes.py as of this migration; later edits
+# to that module must not change what this migration does.
+
+# Start the sequence after the per-row counters so no task ever sees a version again
+START_SEQUENCE = (
+    """INSERT OR REPLACE INTO "task_tableversion" ("name", "version", "modified")
+    SELECT 'task_changes', COALESCE(MAX("version"), 0), strftime('%Y-%m-%d %H:%M:%f', 'now') FROM "task_task";""",
+)
+
+DROP_SEQUENCE = ("""DELETE FROM "task_tableversion" WHERE "name" = 'task_changes';""",)
+
+# Every write moves the task to the end of the change sequence, deletes leave tombstones
+CREATE_CHANGE_TRIGGERS = (
+    """CREATE TRIGGER "task_task_version_insert" AFTER INSERT ON "task_task" BEGIN
+        INSERT OR IGNORE INTO "task_tableversion" ("name", "version", "modified")
+            VALUES ('task_changes', 0, strftime('%Y-%m-%d %H:%M:%f', 'now'));
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE "name" = 'task_changes';
+        UPDATE "task_task" SET "version" = (
+            SELECT "version" FROM "task_tableversion" WHERE "name" = 'task_changes'
+        ) WHERE "id" = new.id;
+    END;""",
+    """CREATE TRIGGER "task_task_version_update" AFTER UPDATE ON "task_task"
+    WHEN new.version = old.version BEGIN
+        INSERT OR IGNORE INTO "task_tableversion" ("name", "version", "modified")
+            VALUES ('task_changes', 0, strftime('%Y-%m-%d %H:%M:%f', 'now'));
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE "name" = 'task_changes';
+        UPDATE "task_task" SET "version" = (
+            SELECT "version" FROM "task_tableversion" WHERE "name" = 'task_changes'
+        ) WHERE "id" = new.id;
+    END;""",
+    """CREATE TRIGGER "task_task_version_tags_insert" AFTER INSERT ON "task_task_tags" BEGIN
+        INSERT OR IGNORE INTO "task_tableversion" ("name", "version", "modified")
+            VALUES ('task_changes', 0, strftime('%Y-%m-%d %H:%M:%f', 'now'));
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE "name" = 'task_changes';
+        UPDATE "task_task" SET "version" = (
+            SELECT "version" FROM "task_tableversion" WHERE "name" = 'task_changes'
+        ) WHERE "id" = new.task_id;
+    END;""",
+    """CREATE TRIGGER "task_task_version_tags_delete" AFTER DELETE ON "task_task_tags" BEGIN
+        INSERT OR IGNORE INTO "task_tableversion" ("name", "version", "modified")
+            VALUES ('task_changes', 0, strftime('%Y-%m-%d %H:%M:%f', 'now'));
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE "name" = 'task_changes';
+        UPDATE "task_task" SET "version" = (
+            SELECT "version" FROM "task_tableversion" WHERE "name" = 'task_changes'
+        ) WHERE "id" = old.task_id;
+    END;""",
+    """CREATE TRIGGER "task_task_version_tag_update" AFTER UPDATE OF name ON "task_tag" BEGIN
+        INSERT OR IGNORE INTO "task_tableversion" ("name", "version", "modified")
+            VALUES ('task_changes', 0, strftime('%Y-%m-%d %H:%M:%f', 'now'));
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE "name" = 'task_changes';
+        UPDATE "task_task" SET "version" = (
+            SELECT "version" FROM "task_tableversion" WHERE "name" = 'task_changes'
+        ) WHERE "id" IN (SELECT "task_id" FROM "task_task_tags" WHERE "tag_id" = new.id);
+    END;""",
+    """CREATE TRIGGER "task_task_version_delete" AFTER DELETE ON "task_task" BEGIN
+        INSERT OR IGNORE INTO "task_tableversion" ("name", "version", "modified")
+            VALUES ('task_changes', 0, strftime('%Y-%m-%d %H:%M:%f', 'now'));
+        UPDATE "task_tableversion" SET "version" = "version" + 1,
+            "modified" = strftime('%Y-%m-%d %H:%M:%f', 'now') WHERE "name" = 'task_changes';
+        INSERT INTO "task_tasktombstone" ("task_id", "seq", "deleted_at") VALUES (
+            old.id,
+            (SELECT "version" FROM "task_tableversion" WHERE "name" = 'task_changes'),
+            strftime('%Y-%m-%d %H:%M:%f', 'now')
+        );
+    END;""",
+)
+
+DROP_CHANGE_TRIGGERS = (
+    'DROP TRIGGER IF EXISTS "task_task_version_insert";',
+    'DROP TRIGGER IF EXISTS "task_task_version_update";',
+    'DROP TRIGGER IF EXISTS "task_task_version_tags_insert";',
+    'DROP TRIGGER IF EXISTS "task_task_version_tags_delete";',
+    'DROP TRIGGER IF EXISTS "task_task_version_tag_update";',
+    'DROP TRIGGER IF EXISTS "task_task_version_delete";',
+)
+
+# The per-row counter triggers created by migration 0007
+CREATE_ROW_VERSION_TRIGGERS = (
+    """CREATE TRIGGER "task_task_version_update" AFTER UPDATE ON "task_task"
+    WHEN new.version = old.version BEGIN
+        UPDATE "task_task" SET "version" = old.version + 1 WHERE "id" = new.id;
+    END;""",
+    """CREATE TRIGGER "task_task_version_tags_insert" AFTER INSERT ON "task_task_tags" BEGIN
+        UPDATE "task_task" SET "version" = "version" + 1 WHERE "id" = new.task_id;
+    END;""",
+    """CREATE TRIGGER "task_task_version_tags_delete" AFTER DELETE ON "task_task_tags" BEGIN
+        UPDATE "task_task" SET "version" = "version" + 1 WHERE "id" = old.task_id;
+    END;""",
+    """CREATE TRIGGER "task_task_version_tag_update" AFTER UPDATE OF name ON "task_tag" BEGIN
+        UPDATE "task_task" SET "version" = "version" + 1
+        WHERE "id" IN (SELECT "task_id" FROM "task_task_tags" WHERE "tag_id" = new.id);
+    END;""",
+)
+
+DROP_ROW_VERSION_TRIGGERS = (
+    'DROP TRIGGER IF EXISTS "task_task_version_update";',
+    'DROP TRIGGER IF EXISTS "task_task_version_tags_insert";',
+    'DROP TRIGGER IF EXISTS "task_task_version_tags_delete";',
+    'DROP TRIGGER IF EXISTS "task_task_version_tag_update";',
+)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("task", "0007_task_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("task_id", models.BigIntegerField()),
+                ("seq", models.BigIntegerField(unique=True)),
+                ("deleted_at", models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(fields=["version", "id"], name="task_version_id_idx"),
+        ),
+        migrations.RunSQL(START_SEQUENCE, DROP_SEQUENCE),
+        migrations.RunSQL(
+            DROP_ROW_VERSION_TRIGGERS + CREATE_CHANGE_TRIGGERS,
+            DROP_CHANGE_TRIGGERS + CREATE_ROW_VERSION_TRIGGERS,
+        ),
+    ]
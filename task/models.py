@@ -1,11 +1,12 @@
-from django.db import models
+from django.db import models, transaction
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
 
 # Model for Tag
 class Tag(models.Model):
-    name = models.CharField(max_length=100)
+    # NOCASE makes both the unique index and name lookups case-insensitive (ASCII letters)
+    name = models.CharField(max_length=100, unique=True, db_collation="NOCASE")
 
     def __str__(self):
         return self.name
@@ -26,18 +27,103 @@ class Task(models.Model):
     due_date = models.DateField(blank=True, null=True)
     tags = models.ManyToManyField(Tag, blank=True)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="OPEN", blank=False, null=False)
+    # Position in the task change sequence, moved by database triggers on every
+    # change to the row, its tags or their names (see task/changes.py)
+    version = models.BigIntegerField(default=0, editable=False)
+
+    class Meta:
+        indexes = [
+            # Backs keyset pagination of the task list
+            models.Index(fields=["timestamp", "id"], name="task_timestamp_id_idx"),
+            # Status filters walk the list in page order without a sort
+            models.Index(fields=["status", "timestamp", "id"], name="task_status_timestamp_id_idx"),
+            models.Index(fields=["due_date", "status"], name="task_due_date_status_idx"),
+            # Backs the changes feed, which walks tasks in change sequence order
+            models.Index(fields=["version", "id"], name="task_version_id_idx"),
+        ]
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember what was loaded so save() can write only the fields that changed
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def get_changed_fields(self):
+        """
+        Names of the concrete fields modified since the row was loaded,
+        or None when the instance is new or was not loaded from the database.
+        """
+        loaded = getattr(self, "_loaded_values", None)
+        if self._state.adding or loaded is None:
+            return None
+        deferred = self.get_deferred_fields()
+        return [
+            field.name
+            for field in self._meta.concrete_fields
+            if (field.attname in loaded and getattr(self, field.attname) != loaded[field.attname])
+            or (field.attname not in loaded and field.attname not in deferred)
+        ]
+
     # Custom validation: Check if due date is before current timestamp
     def clean(self):
+        changed = self.get_changed_fields()
+        if changed is not None and "due_date" not in changed:
+            return
         current_timestamp = timezone.now()
         if self.due_date and self.due_date < current_timestamp.date():
             raise ValidationError("Due Date cannot be before Timestamp created.")
 
     def save(self, *args, **kwargs):
-        self.full_clean()
-        super().save(*args, **kwargs)
-        # Remove duplicate tags
-        self.tags.set(list(set(self.tags.all())))
+        # Tags need no clean-up here: the task/tag through table is unique on (task, tag)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None and not kwargs.get("force_insert"):
+            update_fields = self.get_changed_fields()
+            kwargs["update_fields"] = update_fields
+        if update_fields is None:
+            self.full_clean()
+        else:
+            update_fields = set(update_fields)
+            exclude = [
+                f.name
+                for f in self._meta.fields
+                if f.name not in update_fields and f.attname not in update_fields
+            ]
+            self.full_clean(exclude=exclude, validate_unique=False)
+
+        with transaction.atomic(using=kwargs.get("using"), savepoint=False):
+            super().save(*args, **kwargs)
+
+        deferred = self.get_deferred_fields()
+        loaded = getattr(self, "_loaded_values", {})
+        for field in self._meta.concrete_fields:
+            if field.attname not in deferred and (
+                update_fields is None or field.name in update_fields or field.attname in update_fields
+            ):
+                loaded[field.attname] = getattr(self, field.attname)
+        self._loaded_values = loaded
+
+
+# Change counter per API resource ("task", "tag"), bumped by database triggers
+# on every write to the tables the resource is built from
+class TableVersion(models.Model):
+    name = models.CharField(max_length=50, primary_key=True)
+    version = models.BigIntegerField(default=0)
+    modified = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
+
+
+# Left behind by a deleted task so sync clients learn about the deletion,
+# written by a database trigger and pruned after a retention window
+class TaskTombstone(models.Model):
+    task_id = models.BigIntegerField()
+    seq = models.BigIntegerField(unique=True)
+    deleted_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    def __str__(self):
+        return f"task {self.task_id} deleted at {self.seq}"
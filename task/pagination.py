@@ -0,0 +1,142 @@
+import base64
+import binascii
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ParseError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from .search import search_tasks
+
+
+def encode_cursor(position):
+    # Opaque to clients: a urlsafe base64 wrapper around the JSON position tuple
+    payload = json.dumps(position, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (ValueError, UnicodeError, binascii.Error):
+        raise ParseError("Invalid cursor.")
+    if not isinstance(position, list):
+        raise ParseError("Invalid cursor.")
+    return position
+
+
+def seek_after(queryset, timestamp, pk):
+    """
+    Order by (timestamp, id) and keep only the rows after the given position.
+    The leading timestamp__gte keeps this a range seek on the (timestamp, id) index.
+    """
+    queryset = queryset.order_by("timestamp", "id")
+    if timestamp is None:
+        return queryset
+    return queryset.filter(Q(timestamp__gte=timestamp) & (Q(timestamp__gt=timestamp) | Q(id__gt=pk)))
+
+
+class TaskCursorPagination(BasePagination):
+    """
+    Keyset pagination over (timestamp, id).
+
+    Each page is an index range scan starting right after the last row of the
+    previous page, so page N costs the same as page 1.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+
+    def get_page_size(self, request):
+        page_size = getattr(settings, "TASK_PAGE_SIZE", 100)
+        max_page_size = getattr(settings, "TASK_MAX_PAGE_SIZE", 1000)
+        if self.page_size_query_param in request.query_params:
+            try:
+                page_size = int(request.query_params[self.page_size_query_param])
+            except ValueError:
+                raise ParseError("page_size must be a positive integer.")
+            if page_size < 1:
+                raise ParseError("page_size must be a positive integer.")
+        return min(page_size, max_page_size)
+
+    def get_position(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        position = decode_cursor(cursor)
+        if len(position) != 2 or not isinstance(position[1], int):
+            raise ParseError("Invalid cursor.")
+        timestamp = parse_datetime(position[0]) if isinstance(position[0], str) else None
+        if timestamp is None:
+            raise ParseError("Invalid cursor.")
+        return timestamp, position[1]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        position = self.get_position(request)
+
+        queryset = seek_after(queryset, *(position or (None, None)))
+
+        # Fetch one extra row to know whether there is a next page without a COUNT
+        page = list(queryset[: page_size + 1])
+        self.has_next = len(page) > page_size
+        page = page[:page_size]
+        self.next_position = None
+        if self.has_next:
+            last = page[-1]
+            self.next_position = [last.timestamp.isoformat(), last.id]
+        return page
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+
+class TaskSearchPagination(TaskCursorPagination):
+    """
+    Keyset pagination over (bm25 score, id) for ?q= full-text searches.
+
+    Scores depend on the whole index, so results can shift slightly between
+    pages when tasks are written in the meantime.
+    """
+
+    search_query_param = "q"
+
+    def get_position(self, request):
+        cursor = request.query_params.get(self.cursor_query_param)
+        if not cursor:
+            return None
+        position = decode_cursor(cursor)
+        if (
+            len(position) != 2
+            or not isinstance(position[0], (int, float))
+            or isinstance(position[0], bool)
+            or not isinstance(position[1], int)
+        ):
+            raise ParseError("Invalid cursor.")
+        return position[0], position[1]
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        text = request.query_params.get(self.search_query_param, "")
+        if not text.strip():
+            raise ParseError("q must not be empty.")
+        page_size = self.get_page_size(request)
+        rows = search_tasks(text, queryset, self.get_position(request), limit=page_size + 1)
+        self.next_position = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last, score = rows[-1]
+            self.next_position = [score, last.id]
+        return [task for task, _ in rows]
@@ -0,0 +1,174 @@
+import codecs
+import datetime
+
+import msgpack
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised by patching orjson to None
+    orjson = None
+
+# Dates and datetimes are encoded natively by orjson as ISO 8601, with "Z" for
+# UTC like DRF's encoder. Anything else orjson does not know (Decimal, UUID,
+# lazy strings, ...) goes through DRF's encoder.
+ORJSON_OPTIONS = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+_encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+def encode_json(data):
+    """
+    Encode data as compact UTF-8 JSON bytes, with orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=_encoder.default, option=ORJSON_OPTIONS)
+    return _encoder.encode(data).encode("utf-8")
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer producing the same compact output through encode_json.
+
+    Requests for indented output (Accept: application/json; indent=4) and the
+    stdlib fallback use DRF's implementation unchanged.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type, renderer_context or {}) or orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same escaping as JSONRenderer, so the output stays safe to embed in <script> tags
+        return encode_json(data).replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSONParser reading UTF-8 bodies with orjson straight from bytes, without
+    decoding them to a str first. Other charsets use DRF's implementation.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+
+
+# MessagePack payloads carry dates as integers: days since 1970-01-01 for dates
+# and microseconds since 1970-01-01 UTC for datetimes
+MSGPACK_DATE_FIELDS = ("due_date",)
+MSGPACK_DATETIME_FIELDS = ("timestamp",)
+
+EPOCH_DATE = datetime.date(1970, 1, 1)
+EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _date_to_int(value):
+    if isinstance(value, str):
+        value = datetime.date.fromisoformat(value)
+    return (value - EPOCH_DATE).days
+
+
+def _datetime_to_int(value):
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    delta = value - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _pack_dates(data):
+    # Serializers hand dates over as ISO strings; fields that do not parse are left alone
+    if isinstance(data, list):
+        return [_pack_dates(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    packed = {}
+    for key, value in data.items():
+        if value is None:
+            packed[key] = value
+            continue
+        try:
+            if key in MSGPACK_DATE_FIELDS:
+                value = _date_to_int(value)
+            elif key in MSGPACK_DATETIME_FIELDS:
+                value = _datetime_to_int(value)
+            elif isinstance(value, (dict, list)):
+                value = _pack_dates(value)
+        except (TypeError, ValueError):
+            pass
+        packed[key] = value
+    return packed
+
+
+def _unpack_dates(data):
+    # Integer dates sent by clients become the ISO strings the serializers expect
+    if isinstance(data, list):
+        return [_unpack_dates(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    unpacked = {}
+    for key, value in data.items():
+        if key in MSGPACK_DATE_FIELDS and isinstance(value, int) and not isinstance(value, bool):
+            try:
+                value = (EPOCH_DATE + datetime.timedelta(days=value)).isoformat()
+            except OverflowError:
+                raise ParseError(f"{key} is out of range.")
+        elif isinstance(value, (dict, list)):
+            value = _unpack_dates(value)
+        unpacked[key] = value
+    return unpacked
+
+
+def _msgpack_default(value):
+    # Values DRF leaves as objects: dates, Decimals, UUIDs, lazy strings
+    if isinstance(value, datetime.datetime):
+        return _datetime_to_int(value)
+    if isinstance(value, datetime.date):
+        return _date_to_int(value)
+    return _encoder.default(value)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Renders responses as MessagePack for clients sending Accept: application/msgpack.
+
+    Tags are names like in JSON; due_date and timestamp are integers (see
+    MSGPACK_DATE_FIELDS and MSGPACK_DATETIME_FIELDS) instead of ISO strings.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(_pack_dates(data), default=_msgpack_default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    """
+    Parses application/msgpack request bodies, integer due_date values included.
+    """
+
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            data = msgpack.unpackb(stream.read(), raw=False, strict_map_key=True)
+        except (msgpack.UnpackException, ValueError, TypeError) as exc:
+            raise ParseError("MessagePack parse error - %s" % str(exc))
+        return _unpack_dates(data)
@@ -0,0 +1,44 @@
+from django.db import connection
+
+from .models import Task
+
+# External content FTS5 index over task_task, kept in step with every write by
+# triggers. Both are installed by migration 0005_task_fts; a migration that
+# rebuilds task_task drops the triggers and has to create them again.
+FTS_TABLE = "task_task_fts"
+
+
+def build_match_query(text):
+    # Quote every word so user input can never be read as FTS5 query syntax;
+    # the quoted words are ANDed together
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+def search_tasks(text, queryset=None, position=None, limit=100):
+    """
+    Full-text search over task titles and descriptions, best matches first.
+
+    Returns up to limit (task, score) pairs ordered by bm25 score and id.
+    queryset restricts the candidates (for example to the result of
+    filter_tasks) and the rows are loaded through it, so its only() and
+    prefetch_related() apply. position, a (score, id) pair taken from the last
+    row of the previous page, continues after that row.
+    """
+    score = f'bm25("{FTS_TABLE}")'
+    sql = f'SELECT rowid, {score} AS score FROM "{FTS_TABLE}" WHERE "{FTS_TABLE}" MATCH %s'
+    params = [build_match_query(text)]
+    if queryset is not None and queryset.query.where:
+        subquery, subquery_params = queryset.values("id").query.sql_with_params()
+        sql += f" AND rowid IN ({subquery})"
+        params.extend(subquery_params)
+    if position is not None:
+        sql += f" AND ({score} > %s OR ({score} = %s AND rowid > %s))"
+        params.extend([position[0], position[0], position[1]])
+    sql += " ORDER BY score, rowid LIMIT %s"
+    params.append(limit)
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+    tasks = (Task.objects.all() if queryset is None else queryset).in_bulk([pk for pk, _ in rows])
+    return [(tasks[pk], score) for pk, score in rows if pk in tasks]
@@ -1,5 +1,10 @@
+from django.db import transaction
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS, ManyRelatedField
 from .models import Task, Tag
+from .tags import resolve_tags
+
+allowed_fields = set(["title", "description", "due_date", "tags", "status"])
 
 
 class TagSerializer(serializers.ModelSerializer):
@@ -8,19 +13,50 @@ class TagSerializer(serializers.ModelSerializer):
         fields = "__all__"
 
 
+class CustomTagListField(ManyRelatedField):
+    # Resolves every tag name of the list in one batch instead of one lookup per name
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, "__iter__"):
+            self.fail("not_a_list", input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail("empty")
+        names = [self.child_relation.validate_name(item) for item in data]
+        # Bulk writes resolve the tags of the whole payload up front and pass them in the context
+        tags = self.context.get("resolved_tags", {})
+        if any(name not in tags for name in names):
+            tags = resolve_tags(names)
+        # Names that differ only by case resolve to the same tag
+        return list({tags[name].pk: tags[name] for name in names}.values())
+
+
 class CustomTagField(serializers.RelatedField):
+    default_error_messages = {
+        "invalid": "Tag name must be a non-empty string of at most {max_length} characters.",
+    }
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {"child_relation": cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return CustomTagListField(**list_kwargs)
+
     def get_queryset(self):
         return Tag.objects.all()
 
     def to_representation(self, value):
         return value.name
 
+    def validate_name(self, data):
+        max_length = Tag._meta.get_field("name").max_length
+        if not isinstance(data, str) or not data.strip() or len(data) > max_length:
+            self.fail("invalid", max_length=max_length)
+        return data
+
     def to_internal_value(self, data):
-        try:
-            tag = Tag.objects.get(name=data)
-        except Tag.DoesNotExist:
-            tag = Tag.objects.create(name=data)
-        return tag
+        name = self.validate_name(data)
+        return resolve_tags([name])[name]
 
 
 class TaskSerializer(serializers.ModelSerializer):
@@ -28,16 +64,23 @@ class TaskSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Task
-        fields = "__all__"
+        exclude = ["version"]
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Sparse fieldsets: drop every field that was not asked for
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
 
     def create(self, validated_data):
         tags_data = validated_data.pop("tags")
 
-        # Create a new Task instance with the extracted data
-        task = Task.objects.create(**validated_data)
-
-        for tag_data in tags_data:
-            task.tags.add(tag_data)
+        with transaction.atomic():
+            # Create a new Task instance with the extracted data
+            task = Task.objects.create(**validated_data)
+            # Attach all tags with a single insert into the through table
+            task.tags.add(*tags_data)
         return task
 
     def update(self, instance, validated_data):
@@ -47,12 +90,10 @@ class TaskSerializer(serializers.ModelSerializer):
         instance.due_date = validated_data.pop("due_date", instance.due_date)
         instance.status = validated_data.pop("status", instance.status)
 
-        # Remove all existing tags from the task
-        if "tags" in validated_data:
-            tags_data = validated_data.pop("tags")
-            instance.tags.clear()
-            for tag_data in tags_data:
-                instance.tags.add(tag_data)
-
-        instance.save()
+        with transaction.atomic():
+            instance.save()
+            # set() diffs against the current tags: one bulk delete of the removed
+            # links and one bulk insert of the new ones, untouched links stay as they are
+            if "tags" in validated_data:
+                instance.tags.set(validated_data.pop("tags"))
         return instance
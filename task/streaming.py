@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+from .pagination import seek_after
+from .renderers import encode_json
+from .serializers import TaskSerializer
+
+
+def iter_task_json(queryset, chunk_size, fields=None):
+    """
+    Yield the tasks of queryset as one JSON array, a chunk of rows at a time.
+
+    Each chunk is a keyset query after the last row of the previous one with its
+    tags prefetched (QuerySet.iterator() skips prefetch_related in Django 3.2), so
+    only chunk_size tasks are ever held in memory. Rows written while the stream
+    is running may or may not be included.
+    """
+    yield b"["
+    separator = b""
+    timestamp = pk = None
+    while True:
+        chunk = list(seek_after(queryset, timestamp, pk)[:chunk_size])
+        if not chunk:
+            break
+        # One encoder call per chunk; the brackets of the chunk's own array are cut off
+        body = encode_json(TaskSerializer(chunk, many=True, fields=fields).data)
+        yield separator + body[1:-1]
+        separator = b","
+        timestamp, pk = chunk[-1].timestamp, chunk[-1].id
+    yield b"]"
+
+
+def stream_tasks_response(queryset, fields=None):
+    chunk_size = getattr(settings, "TASK_STREAM_CHUNK_SIZE", 500)
+    return StreamingHttpResponse(
+        iter_task_json(queryset, chunk_size, fields), content_type="application/json"
+    )
@@ -0,0 +1,105 @@
+import string
+
+from django.db import transaction
+from django.db.models import Count, Min
+from django.db.models.functions import Lower
+
+from .models import Tag
+
+# Stay well below SQLite's bound-parameter limit for IN lookups
+LOOKUP_CHUNK_SIZE = 500
+
+# Mirrors SQLite's NOCASE collation, which only folds ASCII letters
+_NOCASE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def normalize_tag_name(name):
+    return name.translate(_NOCASE)
+
+
+def _fetch_tags(names):
+    found = {}
+    for start in range(0, len(names), LOOKUP_CHUNK_SIZE):
+        end = start + LOOKUP_CHUNK_SIZE
+        chunk = names[start:end]
+        for tag in Tag.objects.filter(name__in=chunk):
+            found[normalize_tag_name(tag.name)] = tag
+    return found
+
+
+def resolve_tags(names):
+    """
+    Map tag names to Tag rows, creating the missing ones.
+
+    Costs one IN lookup, plus one bulk insert and a re-read of the inserted
+    names when some are missing. Names match case-insensitively, like the
+    unique index on Tag.name, so "Urgent" resolves to an existing "urgent".
+    Conflicting inserts from concurrent writers are ignored and the re-read
+    picks up whichever row won.
+    """
+    names = list(dict.fromkeys(names))
+    tags = _fetch_tags(names)
+    missing = {}
+    for name in names:
+        missing.setdefault(normalize_tag_name(name), name)
+    missing = [name for key, name in missing.items() if key not in tags]
+    if missing:
+        Tag.objects.bulk_create([Tag(name=name) for name in missing], ignore_conflicts=True)
+        tags.update(_fetch_tags(missing))
+    return {name: tags[normalize_tag_name(name)] for name in names}
+
+
+def merge_duplicate_tags(tag_model, through_model, batch_size=100):
+    """
+    Fold tags whose names differ only by ASCII case into the oldest of them.
+
+    Task links of the duplicates are re-pointed at the surviving tag with one
+    bulk insert and one bulk delete per batch of duplicate groups, and each
+    batch commits on its own so writers are never blocked for long. Takes the
+    models as arguments so data migrations can pass their historical models.
+    Returns the number of duplicate tags removed.
+    """
+    groups = (
+        tag_model.objects.annotate(key=Lower("name"))
+        .values("key")
+        .annotate(count=Count("id"), keep=Min("id"))
+        .filter(count__gt=1)
+        .order_by("keep")
+    )
+    groups = [(group["key"], group["keep"]) for group in groups]
+    removed = 0
+    for start in range(0, len(groups), batch_size):
+        end = start + batch_size
+        batch = dict(groups[start:end])
+        with transaction.atomic():
+            duplicates = {}
+            for tag_id, key in (
+                tag_model.objects.annotate(key=Lower("name"))
+                .filter(key__in=list(batch))
+                .values_list("id", "key")
+            ):
+                if tag_id != batch[key]:
+                    duplicates[tag_id] = batch[key]
+            links = through_model.objects.filter(tag_id__in=list(duplicates)).values_list("task_id", "tag_id")
+            through_model.objects.bulk_create(
+                [through_model(task_id=task_id, tag_id=duplicates[tag_id]) for task_id, tag_id in links],
+                ignore_conflicts=True,
+            )
+            through_model.objects.filter(tag_id__in=list(duplicates)).delete()
+            removed += tag_model.objects.filter(id__in=list(duplicates)).delete()[0]
+    return removed
+
+
+def prune_orphan_tags(tag_model, through_model, batch_size=500):
+    """
+    Delete tags that no task uses, one short transaction per batch.
+    Returns the number of tags deleted.
+    """
+    orphans = tag_model.objects.exclude(id__in=through_model.objects.values("tag_id"))
+    removed = 0
+    while True:
+        with transaction.atomic():
+            ids = list(orphans.values_list("id", flat=True)[:batch_size])
+            if not ids:
+                return removed
+            removed += tag_model.objects.filter(id__in=ids).delete()[0]
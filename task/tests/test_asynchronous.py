@@ -0,0 +1,116 @@
+import asyncio
+import base64
+import gzip
+import threading
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.test import AsyncRequestFactory, TransactionTestCase
+from rest_framework import status
+from task.asynchronous import as_async_view
+from task.middleware import CompressionMiddleware
+from task.models import Task, Tag
+from task.views import TagListCreateAPIView, TaskRetrieveUpdateDestroyAPIView
+from task.authentication import clear_credentials_cache, issue_token
+from todo.asgi import application
+
+
+class AsyncViewTestCase(TransactionTestCase):
+    def setUp(self):
+        clear_credentials_cache()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.tag = Tag.objects.create(name="Sample Tag")
+        self.task = Task.objects.create(title="Task", description="Sample description", status="OPEN")
+        self.task.tags.add(self.tag)
+        self.token, _ = issue_token(self.user)
+        self.factory = AsyncRequestFactory()
+
+    def get(self, path):
+        # AsyncRequestFactory takes extra keyword arguments as header names
+        return self.factory.get(path, authorization=f"Bearer {self.token}")
+
+    async def test_views_are_coroutines(self):
+        view = as_async_view(TaskRetrieveUpdateDestroyAPIView.as_view())
+        self.assertTrue(asyncio.iscoroutinefunction(view))
+        self.assertTrue(view.csrf_exempt)
+
+    async def test_view_runs_off_the_event_loop_thread(self):
+        threads = []
+        view_class = TagListCreateAPIView.as_view()
+
+        def view(request):
+            threads.append(threading.current_thread().name)
+            return view_class(request)
+
+        response = await as_async_view(view)(self.get("/api/tags/"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(threads[0].startswith("task-api"))
+        # Rendered in the pool already
+        self.assertTrue(response.is_rendered)
+        self.assertIn(b"Sample Tag", response.content)
+
+    async def test_concurrent_requests(self):
+        view = as_async_view(TaskRetrieveUpdateDestroyAPIView.as_view())
+        responses = await asyncio.gather(
+            *[view(self.get(f"/api/tasks/{self.task.id}/"), pk=self.task.id) for _ in range(10)]
+        )
+        self.assertEqual({response.status_code for response in responses}, {status.HTTP_200_OK})
+        self.assertEqual({response.data["title"] for response in responses}, {"Task"})
+
+    async def test_writes(self):
+        view = as_async_view(TaskRetrieveUpdateDestroyAPIView.as_view())
+        request = self.factory.post(
+            "/api/tasks/",
+            {"title": "Async", "description": "D", "tags": ["Sample Tag"]},
+            content_type="application/json",
+            authorization=f"Bearer {self.token}",
+        )
+        response = await view(request)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(await sync_to_async(Task.objects.filter(title="Async").exists)())
+
+    async def test_compression_in_async_chain(self):
+        async def get_response(request):
+            return HttpResponse(b"x" * 4096)
+
+        middleware = CompressionMiddleware(get_response)
+        self.assertTrue(asyncio.iscoroutinefunction(middleware))
+        threads = []
+        process_response = middleware.process_response
+
+        def record_thread(request, response):
+            threads.append(threading.current_thread().name)
+            return process_response(request, response)
+
+        middleware.process_response = record_thread
+        response = await middleware(self.factory.get("/", **{"accept-encoding": "gzip"}))
+        self.assertTrue(threads[0].startswith("task-api"))
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), b"x" * 4096)
+
+    async def asgi_get(self, path, query):
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query,
+            "headers": [(b"authorization", b"Basic " + base64.b64encode(b"testuser:testpassword"))],
+        }
+        messages = asyncio.Queue()
+        await messages.put({"type": "http.request", "body": b"", "more_body": False})
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await application(scope, messages.get, send)
+        return sent[0]["status"], b"".join(message.get("body", b"") for message in sent)
+
+    async def test_stream_is_refused_under_asgi(self):
+        # The chunk queries would run on the event loop and fail
+        code, body = await self.asgi_get("/api/tasks/", b"stream=true")
+        self.assertEqual(code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(b"stream is not available under ASGI.", body)
+        code, body = await self.asgi_get("/api/tasks/", b"")
+        self.assertEqual(code, status.HTTP_200_OK)
+        self.assertIn(b"Sample description", body)
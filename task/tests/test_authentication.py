@@ -0,0 +1,103 @@
+import base64
+import time
+from unittest import mock
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth import base_user
+from django.contrib.auth.models import User
+from django.test import override_settings
+from task.authentication import clear_credentials_cache, issue_token
+from task.models import Tag
+
+
+class CachedBasicAuthenticationTestCase(APITestCase):
+    def setUp(self):
+        clear_credentials_cache()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.tag = Tag.objects.create(name="Sample Tag")
+        self.check_password = mock.patch.object(base_user, "check_password", wraps=base_user.check_password)
+        self.check = self.check_password.start()
+        self.addCleanup(self.check_password.stop)
+
+    def get(self, password="testpassword", username="testuser"):
+        credentials = base64.b64encode(f"{username}:{password}".encode("utf-8")).decode("utf-8")
+        return self.client.get(f"/api/tags/{self.tag.id}/", HTTP_AUTHORIZATION=f"Basic {credentials}")
+
+    def test_repeat_requests_skip_password_hash(self):
+        for _ in range(3):
+            self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+        self.assertEqual(self.check.call_count, 1)
+
+    def test_wrong_password_is_not_cached(self):
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+        for _ in range(2):
+            self.assertEqual(self.get(password="wrong").status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.check.call_count, 3)
+
+    def test_password_change_invalidates(self):
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+        self.user.set_password("newpassword")
+        self.user.save()
+        self.assertEqual(self.get().status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.get(password="newpassword").status_code, status.HTTP_200_OK)
+
+    def test_inactive_user_is_rejected(self):
+        self.assertEqual(self.get().status_code, status.HTTP_200_OK)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertEqual(self.get().status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @override_settings(TASK_AUTH_CACHE_TTL=0)
+    def test_expired_entries_are_verified_again(self):
+        self.get()
+        self.get()
+        self.assertEqual(self.check.call_count, 2)
+
+    @override_settings(TASK_AUTH_CACHE_SIZE=1)
+    def test_cache_size_is_bounded(self):
+        User.objects.create_user(username="other", password="otherpassword")
+        self.get()
+        self.get(username="other", password="otherpassword")
+        self.get()
+        self.assertEqual(self.check.call_count, 3)
+
+
+class BearerTokenAuthenticationTestCase(APITestCase):
+    def setUp(self):
+        clear_credentials_cache()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.tag = Tag.objects.create(name="Sample Tag")
+
+    def get(self, token):
+        return self.client.get(f"/api/tags/{self.tag.id}/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def test_exchange_credentials_for_token(self):
+        credentials = base64.b64encode(b"testuser:testpassword").decode("utf-8")
+        response = self.client.post("/api/token/", HTTP_AUTHORIZATION=f"Basic {credentials}")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["expires_in"], 900)
+        response = self.get(response.data["token"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["name"], "Sample Tag")
+
+    def test_token_requires_credentials(self):
+        response = self.client.post("/api/token/")
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_token_request_skips_password_and_user_lookup(self):
+        token, _ = issue_token(self.user)
+        with mock.patch.object(base_user, "check_password") as check:
+            # The tag row and the table version; no auth_user query
+            with self.assertNumQueries(2):
+                response = self.get(token)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        check.assert_not_called()
+
+    def test_tampered_token_is_rejected(self):
+        token, _ = issue_token(self.user)
+        self.assertEqual(self.get(token[:-1] + "x").status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.get("not-a-token").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_expired_token_is_rejected(self):
+        token, expires_in = issue_token(self.user)
+        with mock.patch("django.core.signing.time.time", return_value=time.time() + expires_in + 1):
+            self.assertEqual(self.get(token).status_code, status.HTTP_401_UNAUTHORIZED)
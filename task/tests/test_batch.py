@@ -0,0 +1,203 @@
+import base64
+from unittest import mock
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import override_settings
+from task.authentication import CachedBasicAuthentication, clear_credentials_cache
+from task.models import Task, Tag
+
+
+class BatchTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        self.tag = Tag.objects.create(name="Sample Tag")
+        self.task = Task.objects.create(title="Task", description="Sample description", status="OPEN")
+        self.task.tags.add(self.tag)
+
+    def batch(self, operations, mode=None):
+        path = "/api/batch/" if mode is None else f"/api/batch/?mode={mode}"
+        return self.client.post(path, operations, format="json")
+
+    def new_task(self, title):
+        return {"title": title, "description": "D", "tags": ["Sample Tag"], "status": "OPEN"}
+
+    def test_operations_run_in_order(self):
+        response = self.batch(
+            [
+                {"method": "POST", "path": "/api/tasks/", "body": self.new_task("Batched")},
+                {"method": "PUT", "path": f"/api/tasks/{self.task.id}/", "body": {"title": "Renamed"}},
+                {"method": "GET", "path": f"/api/tasks/{self.task.id}/?fields=id,title"},
+                {"method": "get", "path": "/api/tags/"},
+            ]
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([r["status"] for r in results], [201, 200, 200, 200])
+        self.assertEqual(results[0]["body"]["title"], "Batched")
+        self.assertEqual(results[2]["body"], {"id": self.task.id, "title": "Renamed"})
+        self.assertEqual(results[3]["body"], [{"id": self.tag.id, "name": "Sample Tag"}])
+        self.assertTrue(Task.objects.filter(title="Batched").exists())
+
+    def test_best_effort_reports_failures(self):
+        response = self.batch(
+            [
+                {"method": "GET", "path": "/api/tasks/999/"},
+                {"method": "POST", "path": "/api/tags/", "body": {"name": "Other"}},
+            ]
+        )
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        results = response.data["results"]
+        self.assertEqual(results[0], {"status": 400, "body": {"error": "Task with id = 999 not found."}})
+        self.assertEqual(results[1]["status"], 201)
+        self.assertTrue(Tag.objects.filter(name="Other").exists())
+
+    def test_atomic_rolls_back_on_failure(self):
+        response = self.batch(
+            [
+                {"method": "POST", "path": "/api/tags/", "body": {"name": "Other"}},
+                {"method": "DELETE", "path": f"/api/tasks/{self.task.id}/"},
+                {"method": "PUT", "path": "/api/tags/0/", "body": {"name": "Missing"}},
+                {"method": "POST", "path": "/api/tags/", "body": {"name": "Later"}},
+            ],
+            mode="atomic",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([r["status"] for r in response.data["results"]], [424, 424, 400, 424])
+        self.assertFalse(Tag.objects.filter(name="Other").exists())
+        self.assertTrue(Task.objects.filter(id=self.task.id).exists())
+
+    def test_atomic_refuses_reads(self):
+        # A read inside the transaction would cache what the rollback discards
+        response = self.batch(
+            [
+                {"method": "PATCH", "path": f"/api/tasks/{self.task.id}/", "body": {"title": "GHOST"}},
+                {"method": "GET", "path": "/api/tasks/"},
+                {"method": "PUT", "path": "/api/tags/0/", "body": {"name": "Missing"}},
+            ],
+            mode="atomic",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"], "Operation 1: GET cannot be used in atomic mode.")
+        response = self.client.patch(
+            f"/api/tasks/{self.task.id}/", {"description": "Committed"}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task = self.client.get("/api/tasks/").data["results"][0]
+        self.assertEqual((task["title"], task["description"]), ("Task", "Committed"))
+
+    def test_atomic_rollback_does_not_cache_reads(self):
+        # The rollback also rolls back the change sequence, so the next real write reuses the version
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.batch(
+                [
+                    {"method": "PUT", "path": f"/api/tasks/{self.task.id}/", "body": {"title": "phantom"}},
+                    {"method": "POST", "path": "/api/tasks/lookup/", "body": {"ids": [self.task.id]}},
+                    {"method": "PUT", "path": "/api/tags/0/", "body": {"name": "Missing"}},
+                ],
+                mode="atomic",
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            response = self.client.put(f"/api/tasks/{self.task.id}/", {"title": "real"}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            response = self.client.get(f"/api/tasks/?ids={self.task.id}")
+            self.assertEqual(response.data["results"][0]["title"], "real")
+            response = self.client.get("/api/tasks/changes/")
+            self.assertEqual([task["title"] for task in response.data["results"]], ["real"])
+
+    def test_atomic_commits(self):
+        response = self.batch(
+            [
+                {"method": "POST", "path": "/api/tags/", "body": {"name": "Other"}},
+                {"method": "DELETE", "path": f"/api/tasks/{self.task.id}/"},
+            ],
+            mode="atomic",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([r["status"] for r in response.data["results"]], [201, 204])
+        self.assertTrue(Tag.objects.filter(name="Other").exists())
+        self.assertFalse(Task.objects.filter(id=self.task.id).exists())
+
+    def test_reads_see_earlier_writes(self):
+        response = self.batch(
+            [
+                {"method": "GET", "path": "/api/tags/"},
+                {"method": "POST", "path": "/api/tags/", "body": {"name": "Other"}},
+                {"method": "GET", "path": "/api/tags/"},
+            ]
+        )
+        results = response.data["results"]
+        self.assertEqual(len(results[0]["body"]), 1)
+        self.assertEqual(len(results[2]["body"]), 2)
+
+    def test_credentials_are_checked_once(self):
+        self.client.force_authenticate(user=None)
+        clear_credentials_cache()
+        credentials = base64.b64encode(b"testuser:testpassword").decode()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Basic {credentials}")
+        operations = [{"method": "GET", "path": f"/api/tasks/{self.task.id}/"}] * 5
+        calls = []
+        original = CachedBasicAuthentication.authenticate
+
+        def authenticate(authenticator, request):
+            calls.append(request)
+            return original(authenticator, request)
+
+        with mock.patch.object(CachedBasicAuthentication, "authenticate", authenticate):
+            response = self.batch(operations)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(calls), 1)
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+        response = self.batch([{"method": "GET", "path": "/api/tags/"}])
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+
+    def test_invalid_batches(self):
+        cases = [
+            {},
+            [],
+            ["GET /api/tags/"],
+            [{"method": "OPTIONS", "path": "/api/tags/"}],
+            [{"method": "GET"}],
+            [{"method": "GET", "path": "/api/tags/", "headers": {}}],
+            [{"method": "GET", "path": "/api/nowhere/"}],
+            [{"method": "POST", "path": "/api/batch/", "body": []}],
+            [{"method": "POST", "path": "/api/token/"}],
+        ]
+        for operations in cases:
+            response = self.batch(operations)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, operations)
+            self.assertIn("error", response.data)
+        response = self.batch([{"method": "GET", "path": "/api/tags/"}], mode="sometimes")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # Nothing ran when one operation was rejected
+        response = self.batch(
+            [
+                {"method": "POST", "path": "/api/tags/", "body": {"name": "Other"}},
+                {"method": "GET", "path": "/api/nowhere/"},
+            ]
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Tag.objects.filter(name="Other").exists())
+
+    @override_settings(TASK_BATCH_MAX_OPERATIONS=2)
+    def test_operation_limit(self):
+        response = self.batch([{"method": "GET", "path": "/api/tags/"}] * 3)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"], "At most 2 operations can be sent in one request.")
+
+    def test_failing_operation_does_not_break_the_batch(self):
+        # PUT without a task id has no handler on the list route
+        with self.assertLogs("task.batch", "ERROR"):
+            response = self.batch(
+                [
+                    {"method": "PUT", "path": "/api/tasks/", "body": {"title": "X"}},
+                    {"method": "GET", "path": "/api/tags/"},
+                ]
+            )
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual([r["status"] for r in response.data["results"]], [500, 200])
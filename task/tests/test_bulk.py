@@ -0,0 +1,186 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from task.models import Task, Tag
+
+
+class TaskBulkCreateTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        Tag.objects.create(name="Existing")
+
+    def make_items(self, count, prefix="New"):
+        return [
+            {
+                "title": f"Task {i}",
+                "description": "Sample description",
+                "tags": ["Existing", f"{prefix} {i % 3}"],
+                "status": "OPEN",
+            }
+            for i in range(count)
+        ]
+
+    def test_bulk_create(self):
+        items = self.make_items(4)
+        response = self.client.post("/api/tasks/", items, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        results = response.data["results"]
+        self.assertEqual([r["status"] for r in results], [201] * 4)
+        self.assertEqual([r["data"]["title"] for r in results], [item["title"] for item in items])
+        self.assertEqual([r["data"]["tags"] for r in results], [item["tags"] for item in items])
+        self.assertEqual(Task.objects.count(), 4)
+        self.assertEqual(Tag.objects.count(), 4)
+
+    def test_query_count_does_not_grow_with_payload(self):
+        counts = []
+        for size in (5, 50):
+            with CaptureQueriesContext(connection) as queries:
+                self.client.post("/api/tasks/", self.make_items(size, prefix=f"Size {size}"), format="json")
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_atomic_mode_rolls_back_on_invalid_item(self):
+        items = self.make_items(3)
+        items[1]["due_date"] = "2000-07-15"
+        items[2]["Illegal_item"] = "Illegal Item"
+        response = self.client.post("/api/tasks/", items, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        results = response.data["results"]
+        self.assertEqual([r["status"] for r in results], [424, 400, 400])
+        self.assertEqual(results[1]["errors"], {"error": "Due Date cannot be before Timestamp created."})
+        self.assertEqual(results[2]["errors"], {"message": "Request body contains illegal elements"})
+        self.assertEqual(Task.objects.count(), 0)
+        self.assertEqual(Tag.objects.count(), 1)
+
+    def test_best_effort_mode_creates_valid_items(self):
+        items = self.make_items(3)
+        items[0]["title"] = ""
+        response = self.client.post("/api/tasks/?mode=best_effort", items, format="json")
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        results = response.data["results"]
+        self.assertEqual([r["status"] for r in results], [400, 201, 201])
+        self.assertIn("title", results[0]["errors"])
+        self.assertEqual(
+            list(Task.objects.order_by("id").values_list("title", flat=True)), ["Task 1", "Task 2"]
+        )
+
+    def test_invalid_requests(self):
+        response = self.client.post("/api/tasks/", [], format="json")
+        self.assertEqual(response.data, {"error": "Request body must be a non-empty list."})
+        response = self.client.post("/api/tasks/?mode=sometimes", self.make_items(1), format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        with override_settings(TASK_BULK_MAX_ITEMS=2):
+            response = self.client.post("/api/tasks/", self.make_items(3), format="json")
+        self.assertEqual(response.data, {"error": "At most 2 items can be sent in one request."})
+
+
+@override_settings(TASK_BULK_CHUNK_SIZE=2)
+class TaskBulkUpdateDeleteTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        self.tag = Tag.objects.create(name="Sample Tag")
+        self.tasks = []
+        for i in range(5):
+            task = Task.objects.create(
+                title=f"Task {i}", description="Sample description", status="OPEN" if i < 3 else "WORKING"
+            )
+            task.tags.add(self.tag)
+            self.tasks.append(task)
+
+    def statuses(self):
+        return list(Task.objects.order_by("id").values_list("status", flat=True))
+
+    def test_patch_by_id_list(self):
+        items = [
+            {"id": self.tasks[0].id, "fields": {"status": "DONE"}},
+            {"id": self.tasks[1].id, "fields": {"status": "DONE"}},
+            {"id": self.tasks[4].id, "fields": {"status": "OPEN", "title": "Reopened"}},
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch("/api/tasks/", items, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"updated": 3})
+        self.assertEqual(self.statuses(), ["DONE", "DONE", "OPEN", "WORKING", "OPEN"])
+        self.assertEqual(Task.objects.get(id=self.tasks[4].id).title, "Reopened")
+        # One UPDATE per distinct field set, and no rows are read
+        verbs = [q["sql"].split()[0] for q in queries]
+        self.assertEqual([verb for verb in verbs if verb in ("SELECT", "UPDATE")], ["UPDATE", "UPDATE"])
+
+    def test_patch_by_filter(self):
+        data = {"filter": {"status": "OPEN"}, "fields": {"status": "DONE"}}
+        response = self.client.patch("/api/tasks/", data, format="json")
+        self.assertEqual(response.data, {"updated": 3})
+        self.assertEqual(self.statuses(), ["DONE", "DONE", "DONE", "WORKING", "WORKING"])
+
+    def test_patch_validation_errors(self):
+        items = [
+            {"id": self.tasks[0].id, "fields": {"status": "DONE"}},
+            {"id": self.tasks[1].id, "fields": {"due_date": "2000-07-15"}},
+            {"id": self.tasks[2].id, "fields": {"tags": ["Other"]}},
+        ]
+        response = self.client.patch("/api/tasks/", items, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([e["index"] for e in response.data["errors"]], [1, 2])
+        self.assertEqual(self.statuses(), ["OPEN", "OPEN", "OPEN", "WORKING", "WORKING"])
+        response = self.client.patch(
+            "/api/tasks/", {"filter": {"status": "LATE"}, "fields": {}}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_patch_invalid_ids(self):
+        for pk in (True, False, "1", 1.0, 2**70, None):
+            items = [{"id": pk, "fields": {"status": "DONE"}}]
+            response = self.client.patch("/api/tasks/", items, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, pk)
+            self.assertEqual(
+                response.data["errors"][0]["errors"], {"message": "Each item needs an integer id"}
+            )
+        self.assertEqual(self.statuses(), ["OPEN", "OPEN", "OPEN", "WORKING", "WORKING"])
+
+    def test_patch_single_task(self):
+        response = self.client.patch(f"/api/tasks/{self.tasks[0].id}/", {"status": "DONE"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "DONE")
+        response = self.client.patch(f"/api/tasks/{self.tasks[0].id}/", [{"status": "OPEN"}], format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {"error": "Request body must be an object."})
+
+    def test_delete_by_ids(self):
+        ids = [self.tasks[0].id, self.tasks[2].id, self.tasks[3].id, 100000]
+        response = self.client.delete("/api/tasks/", {"ids": ids}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"deleted": 3})
+        self.assertEqual(Task.objects.count(), 2)
+        self.assertEqual(Task.tags.through.objects.count(), 2)
+
+    def test_delete_by_invalid_ids(self):
+        for ids in ([2**70], [1.9], [True], "99999999999999999999999"):
+            response = self.client.delete("/api/tasks/", {"ids": ids}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, ids)
+        self.assertEqual(Task.objects.count(), 5)
+
+    def test_delete_by_id_string(self):
+        ids = ",".join(str(pk) for pk in range(100000, 100400))
+        response = self.client.delete("/api/tasks/", {"ids": f"{self.tasks[0].id},{ids}"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"deleted": 1})
+        with override_settings(TASK_BULK_MAX_ITEMS=2):
+            response = self.client.delete("/api/tasks/", {"ids": "1,2,3"}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_delete_by_filter(self):
+        response = self.client.delete("/api/tasks/", {"filter": {"status": ["WORKING"]}}, format="json")
+        self.assertEqual(response.data, {"deleted": 2})
+        self.assertEqual(self.statuses(), ["OPEN", "OPEN", "OPEN"])
+        self.assertEqual(Tag.objects.count(), 1)
+
+    def test_delete_requires_filter(self):
+        response = self.client.delete("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {"error": "filter must be a non-empty object."})
+        self.assertEqual(Task.objects.count(), 5)
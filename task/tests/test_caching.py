@@ -0,0 +1,96 @@
+import datetime
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+from task.caching import cache_stats, reset_cache_stats
+from task.models import Task, Tag
+
+
+class ResponseCacheTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        reset_cache_stats()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        self.tag = Tag.objects.create(name="Sample Tag")
+        self.task = Task.objects.create(
+            title="Test Task",
+            description="Sample description",
+            due_date=timezone.now().date() + datetime.timedelta(days=30),
+            status="OPEN",
+        )
+        self.task.tags.add(self.tag)
+
+    def test_repeat_get_is_served_from_cache(self):
+        first = self.client.get(f"/api/tasks/{self.task.id}/")
+        self.assertEqual(first["X-Cache"], "MISS")
+        # Only the table version lookup for the ETag remains
+        with self.assertNumQueries(1):
+            second = self.client.get(f"/api/tasks/{self.task.id}/")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(cache_stats()["hits"], 1)
+        self.assertEqual(cache_stats()["misses"], 1)
+
+    def test_keys_cover_query_string_and_user(self):
+        self.client.get("/api/tags/")
+        self.assertEqual(self.client.get("/api/tags/?x=1")["X-Cache"], "MISS")
+        other = User.objects.create_user(username="other", password="otherpassword")
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self.client.get("/api/tags/")["X-Cache"], "MISS")
+
+    def test_save_invalidates(self):
+        self.client.get(f"/api/tasks/{self.task.id}/")
+        self.task.title = "Renamed"
+        self.task.save()
+        response = self.client.get(f"/api/tasks/{self.task.id}/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["title"], "Renamed")
+
+    def test_writes_outside_this_process_invalidate(self):
+        # Raw SQL sends no signals, like a write handled by another worker
+        self.client.get(f"/api/tasks/{self.task.id}/")
+        with connection.cursor() as cursor:
+            cursor.execute('UPDATE "task_task" SET "title" = %s WHERE "id" = %s', ["Elsewhere", self.task.id])
+        response = self.client.get(f"/api/tasks/{self.task.id}/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["title"], "Elsewhere")
+
+    def test_tag_changes_invalidate_tasks(self):
+        self.client.get(f"/api/tasks/{self.task.id}/")
+        self.task.tags.add(Tag.objects.create(name="Other"))
+        self.assertEqual(self.client.get(f"/api/tasks/{self.task.id}/").data["tags"], ["Sample Tag", "Other"])
+        self.tag.name = "Renamed Tag"
+        self.tag.save()
+        self.assertIn("Renamed Tag", self.client.get(f"/api/tasks/{self.task.id}/").data["tags"])
+
+    def test_delete_invalidates(self):
+        path = f"/api/tags/{self.tag.id}/"
+        self.client.get(path)
+        self.tag.delete()
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_update_invalidates(self):
+        self.client.get(f"/api/tasks/{self.task.id}/")
+        response = self.client.patch(
+            "/api/tasks/", [{"id": self.task.id, "fields": {"status": "DONE"}}], format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.client.get(f"/api/tasks/{self.task.id}/").data["status"], "DONE")
+
+    def test_errors_are_not_cached(self):
+        self.client.get("/api/tasks/999999/")
+        self.assertEqual(self.client.get("/api/tasks/999999/")["X-Cache"], "MISS")
+
+    def test_stats_require_admin(self):
+        self.assertEqual(self.client.get("/api/cache/stats/").status_code, status.HTTP_403_FORBIDDEN)
+        self.user.is_staff = True
+        self.user.save()
+        self.client.get("/api/tags/")
+        response = self.client.get("/api/cache/stats/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["misses"], 1)
@@ -0,0 +1,108 @@
+import datetime
+from io import StringIO
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.utils import timezone
+from task.changes import encode_change_cursor
+from task.models import Task, Tag, TaskTombstone
+
+
+class TaskChangesTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        self.tag = Tag.objects.create(name="Sample Tag")
+        self.tasks = []
+        for i in range(4):
+            task = Task.objects.create(title=f"Task {i}", description="Sample description", status="OPEN")
+            self.tasks.append(task)
+        self.tasks[0].tags.add(self.tag)
+
+    def sync(self, cursor=None, **params):
+        if cursor:
+            params["since"] = cursor
+        response = self.client.get("/api/tasks/changes/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_first_sync_returns_every_task(self):
+        data = self.sync()
+        self.assertEqual(
+            sorted(t["title"] for t in data["results"]), ["Task 0", "Task 1", "Task 2", "Task 3"]
+        )
+        self.assertEqual(data["deleted"], [])
+        self.assertFalse(data["has_more"])
+        # Nothing changed since
+        data = self.sync(data["cursor"])
+        self.assertEqual((data["results"], data["deleted"]), ([], []))
+
+    def test_updates_creates_and_deletes(self):
+        cursor = self.sync()["cursor"]
+        Task.objects.filter(pk=self.tasks[1].pk).update(status="DONE")
+        Task.objects.create(title="Task 4", description="Sample description")
+        deleted = self.tasks[2].pk
+        self.tasks[2].delete()
+        data = self.sync(cursor)
+        self.assertEqual([t["title"] for t in data["results"]], ["Task 1", "Task 4"])
+        self.assertEqual(data["results"][0]["status"], "DONE")
+        self.assertEqual(data["deleted"], [deleted])
+
+    def test_bulk_delete_leaves_tombstones(self):
+        cursor = self.sync()["cursor"]
+        ids = [task.pk for task in self.tasks[:3]]
+        response = self.client.delete("/api/tasks/", {"ids": ids}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(sorted(self.sync(cursor)["deleted"]), ids)
+
+    def test_tag_changes_are_changes(self):
+        cursor = self.sync()["cursor"]
+        self.tag.name = "Renamed"
+        self.tag.save()
+        self.tasks[3].tags.add(self.tag)
+        data = self.sync(cursor)
+        self.assertEqual([t["title"] for t in data["results"]], ["Task 0", "Task 3"])
+        self.assertEqual(data["results"][0]["tags"], ["Renamed"])
+
+    def test_paging(self):
+        cursor = self.sync()["cursor"]
+        for task in self.tasks[:3]:
+            task.title += " changed"
+            task.save()
+        self.tasks[3].delete()
+        seen, deleted = [], []
+        while True:
+            data = self.sync(cursor, page_size=1)
+            seen += [t["title"] for t in data["results"]]
+            deleted += data["deleted"]
+            cursor = data["cursor"]
+            if not data["has_more"]:
+                break
+        self.assertEqual(seen, ["Task 0 changed", "Task 1 changed", "Task 2 changed"])
+        self.assertEqual(len(deleted), 1)
+
+    def test_expired_cursor(self):
+        cursor = encode_change_cursor(0, 0, timezone.now() - datetime.timedelta(days=31))
+        response = self.client.get("/api/tasks/changes/", {"since": cursor})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/api/tasks/changes/", {"since": "garbage"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_prune_tombstones(self):
+        self.tasks[0].delete()
+        self.tasks[1].delete()
+        oldest = TaskTombstone.objects.order_by("seq").first()
+        TaskTombstone.objects.filter(pk=oldest.pk).update(
+            deleted_at=timezone.now() - datetime.timedelta(days=40)
+        )
+        out = StringIO()
+        call_command("prune_tombstones", stdout=out)
+        self.assertIn("Deleted 1 tombstone(s).", out.getvalue())
+        self.assertEqual(TaskTombstone.objects.count(), 1)
+        # A zero day window keeps nothing
+        TaskTombstone.objects.update(deleted_at=timezone.now() - datetime.timedelta(minutes=1))
+        call_command("prune_tombstones", "--days", "0", stdout=out)
+        self.assertEqual(TaskTombstone.objects.count(), 0)
@@ -0,0 +1,54 @@
+from io import StringIO
+from django.core.management import call_command
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from task.models import Tag, Task
+
+
+class DedupeTagsMigrationTest(TransactionTestCase):
+    before = ("task", "0002_task_timestamp_id_idx")
+
+    def test_duplicates_are_merged_before_unique_index(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate([self.before])
+        apps = executor.loader.project_state([self.before]).apps
+        OldTag = apps.get_model("task", "Tag")
+        OldTask = apps.get_model("task", "Task")
+        urgent, lower, upper, other = [
+            OldTag.objects.create(name=n) for n in ["Urgent", "urgent", "URGENT", "Other"]
+        ]
+        first = OldTask.objects.create(title="First", description="description")
+        second = OldTask.objects.create(title="Second", description="description")
+        first.tags.add(urgent, lower)
+        second.tags.add(upper, other)
+
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+        self.assertEqual(sorted(Tag.objects.values_list("name", flat=True)), ["Other", "Urgent"])
+        self.assertEqual([t.name for t in Task.objects.get(id=first.id).tags.all()], ["Urgent"])
+        self.assertEqual(
+            sorted(t.name for t in Task.objects.get(id=second.id).tags.all()), ["Other", "Urgent"]
+        )
+
+
+class DedupeTagsCommandTest(TestCase):
+    def setUp(self):
+        self.used = Tag.objects.create(name="Used")
+        self.task = Task.objects.create(title="Task", description="description")
+        self.task.tags.add(self.used)
+        for i in range(5):
+            Tag.objects.create(name=f"Orphan {i}")
+
+    def test_keeps_orphans_by_default(self):
+        out = StringIO()
+        call_command("dedupe_tags", stdout=out)
+        self.assertIn("Merged 0 duplicate tag(s).", out.getvalue())
+        self.assertEqual(Tag.objects.count(), 6)
+
+    def test_prune_orphans(self):
+        out = StringIO()
+        call_command("dedupe_tags", "--prune-orphans", "--batch-size", "2", stdout=out)
+        self.assertIn("Deleted 5 orphan tag(s).", out.getvalue())
+        self.assertEqual(list(Tag.objects.all()), [self.used])
@@ -0,0 +1,71 @@
+import gzip
+import brotli
+import zstandard
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, override_settings
+from task.middleware import choose_encoding
+from task.models import Task
+
+DECOMPRESS = {
+    "gzip": gzip.decompress,
+    "br": brotli.decompress,
+    "zstd": lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data),
+}
+
+
+class ChooseEncodingTestCase(SimpleTestCase):
+    def test_negotiation(self):
+        self.assertEqual(choose_encoding("gzip, deflate, br, zstd"), "zstd")
+        self.assertEqual(choose_encoding("gzip, br"), "br")
+        self.assertEqual(choose_encoding("gzip;q=1.0, br;q=0.5"), "gzip")
+        self.assertEqual(choose_encoding("zstd;q=0, br;q=0, *"), "gzip")
+        self.assertEqual(choose_encoding("*;q=0"), None)
+        self.assertEqual(choose_encoding("identity"), None)
+        self.assertEqual(choose_encoding(""), None)
+
+
+class CompressionMiddlewareTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        Task.objects.bulk_create(
+            [Task(title=f"Task {i}", description="Sample description " * 5, status="OPEN") for i in range(50)]
+        )
+
+    def test_each_encoding(self):
+        plain = self.client.get("/api/tasks/").content
+        for encoding, decompress in DECOMPRESS.items():
+            response = self.client.get("/api/tasks/", HTTP_ACCEPT_ENCODING=encoding)
+            self.assertEqual(response["Content-Encoding"], encoding)
+            self.assertEqual(response["Vary"], "Accept, Accept-Encoding")
+            self.assertLess(len(response.content), len(plain))
+            self.assertEqual(int(response["Content-Length"]), len(response.content))
+            self.assertEqual(decompress(response.content), plain)
+
+    def test_small_responses_are_not_compressed(self):
+        task = Task.objects.first()
+        response = self.client.get(f"/api/tasks/{task.id}/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    @override_settings(TASK_COMPRESSION_MIN_SIZE=0)
+    def test_incompressible_bodies_are_sent_as_they_are(self):
+        response = self.client.get("/api/tasks/999/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_streaming_response(self):
+        plain = b"".join(self.client.get("/api/tasks/?stream=true").streaming_content)
+        for encoding, decompress in DECOMPRESS.items():
+            with override_settings(TASK_STREAM_CHUNK_SIZE=7):
+                response = self.client.get("/api/tasks/?stream=true", HTTP_ACCEPT_ENCODING=encoding)
+            self.assertEqual(response["Content-Encoding"], encoding)
+            self.assertEqual(decompress(b"".join(response.streaming_content)), plain)
+
+    def test_etag_is_weakened_and_still_matches(self):
+        response = self.client.get("/api/tasks/", HTTP_ACCEPT_ENCODING="br")
+        self.assertTrue(response["ETag"].startswith('W/"'))
+        response = self.client.get(
+            "/api/tasks/", HTTP_ACCEPT_ENCODING="br", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -0,0 +1,63 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from task.models import Task, Tag
+
+
+class ConditionalGetTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        self.tag = Tag.objects.create(name="Sample Tag")
+        self.task = Task.objects.create(title="Test Task", description="Sample description")
+        self.task.tags.add(self.tag)
+
+    def etag(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("Last-Modified", response)
+        return response["ETag"]
+
+    def test_not_modified(self):
+        etag = self.etag("/api/tasks/")
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/tasks/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_if_modified_since(self):
+        last_modified = self.client.get(f"/api/tasks/{self.task.id}/")["Last-Modified"]
+        response = self.client.get(f"/api/tasks/{self.task.id}/", HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_varies_with_query(self):
+        self.assertNotEqual(self.etag("/api/tasks/"), self.etag("/api/tasks/", status="OPEN"))
+
+    def test_task_writes_change_task_etag(self):
+        writes = [
+            lambda: Task.objects.filter(id=self.task.id).update(status="DONE"),
+            lambda: self.task.tags.remove(self.tag),
+            lambda: Tag.objects.filter(id=self.tag.id).update(name="Renamed"),
+            lambda: self.client.post(
+                "/api/tasks/", [{"title": "New", "description": "d", "tags": []}], format="json"
+            ),
+            lambda: self.client.delete("/api/tasks/", {"ids": [self.task.id]}, format="json"),
+        ]
+        etag = self.etag("/api/tasks/")
+        for write in writes:
+            write()
+            response = self.client.get("/api/tasks/", HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            etag = response["ETag"]
+
+    def test_tag_etag_ignores_task_writes(self):
+        etag = self.etag("/api/tags/")
+        self.task.tags.remove(self.tag)
+        response = self.client.get("/api/tags/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        Tag.objects.create(name="Other")
+        response = self.client.get("/api/tags/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response = self.client.get(f"/api/tags/{self.tag.id}/", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
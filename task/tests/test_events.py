@@ -0,0 +1,141 @@
+import asyncio
+import base64
+from unittest import mock
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from task.authentication import clear_credentials_cache
+from task.events import Broadcaster
+from task.models import Task, Tag
+from todo.asgi import application
+
+
+class BroadcasterPollTestCase(TestCase):
+    def setUp(self):
+        self.tag = Tag.objects.create(name="Sample Tag")
+        self.task = Task.objects.create(title="Task", description="Sample description")
+        self.broadcaster = Broadcaster()
+        self.assertEqual(self.broadcaster.poll(), [])
+
+    def test_nothing_changed(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.broadcaster.poll(), [])
+
+    def test_task_events(self):
+        created = Task.objects.create(title="New", description="Sample description")
+        Task.objects.filter(pk=self.task.pk).update(title="Renamed")
+        events = self.broadcaster.poll()
+        self.assertEqual([name for name, _ in events], ["task.created", "task.updated"])
+        self.assertEqual(events[0][1]["id"], created.pk)
+        self.assertEqual(events[1][1]["title"], "Renamed")
+        pk = created.pk
+        created.delete()
+        self.assertEqual(self.broadcaster.poll(), [("task.deleted", {"id": pk})])
+
+    def test_first_poll_skips_the_latest_change(self):
+        # The newest existing task is already at the current sequence number
+        Task.objects.create(title="Latest", description="Sample description")
+        broadcaster = Broadcaster()
+        self.assertEqual(broadcaster.poll(), [])
+        created = Task.objects.create(title="New", description="Sample description")
+        self.assertEqual(
+            [(name, data["id"]) for name, data in broadcaster.poll()], [("task.created", created.pk)]
+        )
+
+    def test_first_poll_after_a_delete(self):
+        latest = Task.objects.create(title="Latest", description="Sample description")
+        latest.delete()
+        broadcaster = Broadcaster()
+        self.assertEqual(broadcaster.poll(), [])
+        created = Task.objects.create(title="New", description="Sample description")
+        self.assertEqual(
+            [(name, data["id"]) for name, data in broadcaster.poll()], [("task.created", created.pk)]
+        )
+
+    def test_tag_events(self):
+        other = Tag.objects.create(name="Other")
+        self.tag.name = "Renamed"
+        self.tag.save()
+        events = self.broadcaster.poll()
+        self.assertIn(("tag.created", {"id": other.pk, "name": "Other"}), events)
+        self.assertIn(("tag.updated", {"id": self.tag.pk, "name": "Renamed"}), events)
+        pk = other.pk
+        other.delete()
+        self.assertEqual(self.broadcaster.poll(), [("tag.deleted", {"id": pk})])
+
+    def test_replay(self):
+        for i in range(3):
+            self.broadcaster.publish("task.updated", {"id": i})
+        boot = self.broadcaster.boot
+        self.assertEqual([event[0] for event in self.broadcaster.replay(f"{boot}-1")], [2, 3])
+        self.assertEqual(self.broadcaster.replay(f"{boot}-3"), [])
+        self.assertIsNone(self.broadcaster.replay("other-1"))
+
+
+@override_settings(TASK_EVENTS_POLL_INTERVAL=0.01)
+class EventsApplicationTestCase(TestCase):
+    def setUp(self):
+        clear_credentials_cache()
+        User.objects.create_user(username="testuser", password="testpassword")
+        self.broadcaster = Broadcaster()
+        patcher = mock.patch("task.events.broadcaster", self.broadcaster)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def request(self, headers, until):
+        scope = {"type": "http", "method": "GET", "path": "/api/events/", "headers": headers}
+        messages = asyncio.Queue()
+        await messages.put({"type": "http.request", "body": b"", "more_body": False})
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        app = asyncio.ensure_future(application(scope, messages.get, send))
+        body = b""
+        for _ in range(500):
+            body = b"".join(message.get("body", b"") for message in sent)
+            if app.done() or until(body):
+                break
+            await asyncio.sleep(0.01)
+        await messages.put({"type": "http.disconnect"})
+        await asyncio.wait_for(app, 5)
+        return sent[0], body
+
+    def authorization(self):
+        return (b"authorization", b"Basic " + base64.b64encode(b"testuser:testpassword"))
+
+    async def test_requires_authentication(self):
+        start, body = await self.request([], until=lambda body: False)
+        self.assertEqual(start["status"], 401)
+        self.assertIn((b"www-authenticate", b'Basic realm="api"'), start["headers"])
+
+    async def test_streams_changes(self):
+        async def create_when_subscribed():
+            while self.broadcaster.state is None:
+                await asyncio.sleep(0.01)
+            await sync_to_async(Task.objects.create)(title="Pushed", description="Sample description")
+
+        writer = asyncio.ensure_future(create_when_subscribed())
+        start, body = await self.request([self.authorization()], until=lambda body: b"Pushed" in body)
+        await writer
+        self.assertEqual(start["status"], 200)
+        self.assertIn((b"content-type", b"text/event-stream"), start["headers"])
+        self.assertIn(b"event: task.created\ndata: {", body)
+        self.assertIn(f"id: {self.broadcaster.boot}-1\n".encode(), body)
+
+    async def test_last_event_id_resumes(self):
+        for i in range(3):
+            self.broadcaster.publish("task.updated", {"id": i})
+        last = f"{self.broadcaster.boot}-1".encode()
+        start, body = await self.request(
+            [self.authorization(), (b"last-event-id", last)], until=lambda body: body.count(b"event:") == 2
+        )
+        self.assertEqual(body.count(b"event: task.updated"), 2)
+        self.assertNotIn(b'{"id":0}', body)
+
+    async def test_unknown_last_event_id_resets(self):
+        start, body = await self.request(
+            [self.authorization(), (b"last-event-id", b"stale-7")], until=lambda body: b"reset" in body
+        )
+        self.assertIn(b"event: reset\ndata: {}", body)
@@ -0,0 +1,97 @@
+import datetime
+import json
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from task.models import Task, Tag
+
+
+class SparseFieldsetTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        self.tag = Tag.objects.create(name="Sample Tag")
+        self.due_date = timezone.now().date() + datetime.timedelta(days=30)
+        for i in range(5):
+            task = Task.objects.create(
+                title=f"Task {i}", description="Long description", due_date=self.due_date, status="OPEN"
+            )
+            task.tags.add(self.tag)
+        self.task = task
+
+    def get(self, path):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path)
+        task_queries = [q["sql"] for q in queries if '"task_task"' in q["sql"] or '"task_tag"' in q["sql"]]
+        return response, task_queries
+
+    def test_list_selects_only_requested_columns(self):
+        response, queries = self.get("/api/tasks/?fields=id,title,status,due_date")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"][0],
+            {
+                "id": response.data["results"][0]["id"],
+                "title": "Task 0",
+                "due_date": self.due_date.isoformat(),
+                "status": "OPEN",
+            },
+        )
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"description"', queries[0])
+
+    def test_tags_are_loaded_only_when_requested(self):
+        response, queries = self.get("/api/tasks/?fields=title,tags")
+        self.assertEqual(response.data["results"][0], {"title": "Task 0", "tags": ["Sample Tag"]})
+        self.assertEqual(len(queries), 2)
+
+    def test_pagination_with_fields(self):
+        response = self.client.get("/api/tasks/?fields=title&page_size=2")
+        self.assertEqual([t["title"] for t in response.data["results"]], ["Task 0", "Task 1"])
+        response = self.client.get(response.data["next"])
+        self.assertEqual([t["title"] for t in response.data["results"]], ["Task 2", "Task 3"])
+
+    def test_search_with_fields(self):
+        response, queries = self.get("/api/tasks/?q=task&fields=id")
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertEqual(set(response.data["results"][0]), {"id"})
+
+    def test_detail_with_fields(self):
+        response, queries = self.get(f"/api/tasks/{self.task.id}/?fields=title")
+        self.assertEqual(response.data, {"title": "Task 4"})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"description"', queries[0])
+
+    def test_stream_with_fields(self):
+        response = self.client.get("/api/tasks/?stream=true&fields=title")
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(data[0], {"title": "Task 0"})
+
+    def test_unknown_field(self):
+        for path in [
+            "/api/tasks/?fields=title,secret",
+            "/api/tasks/?fields=",
+            f"/api/tasks/{self.task.id}/?fields=x",
+        ]:
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("fields must be", response.data["error"])
+
+    def test_summary_view(self):
+        response, queries = self.get("/api/tasks/?view=summary")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data["results"][0]), {"id", "title", "status", "due_date"})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"description"', queries[0])
+        response, _ = self.get(f"/api/tasks/{self.task.id}/?view=summary")
+        self.assertEqual(response.data["title"], "Task 4")
+        self.assertNotIn("tags", response.data)
+
+    def test_invalid_view(self):
+        for path in ["/api/tasks/?view=full", "/api/tasks/?view=summary&fields=id"]:
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("view", response.data["error"])
@@ -0,0 +1,63 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from django.utils import timezone
+from task.models import Task, Tag
+
+
+class TaskListFilterTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        today = timezone.now().date()
+        self.urgent = Tag.objects.create(name="Urgent")
+        self.home = Tag.objects.create(name="Home")
+        specs = [
+            ("Both", "OPEN", 1, [self.urgent, self.home]),
+            ("Urgent only", "WORKING", 5, [self.urgent]),
+            ("Home only", "OPEN", 10, [self.home]),
+            ("No tags", "DONE", None, []),
+        ]
+        for title, task_status, days, tags in specs:
+            due_date = today + timezone.timedelta(days=days) if days is not None else None
+            task = Task.objects.create(
+                title=title, description="description", status=task_status, due_date=due_date
+            )
+            task.tags.add(*tags)
+        self.today = today
+
+    def titles(self, params):
+        response = self.client.get("/api/tasks/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task["title"] for task in response.data["results"]]
+
+    def test_filter_by_status(self):
+        self.assertEqual(self.titles({"status": "OPEN"}), ["Both", "Home only"])
+        self.assertEqual(self.titles({"status": "WORKING,DONE"}), ["Urgent only", "No tags"])
+
+    def test_filter_by_due_date_range(self):
+        after = (self.today + timezone.timedelta(days=5)).isoformat()
+        before = (self.today + timezone.timedelta(days=9)).isoformat()
+        self.assertEqual(self.titles({"due_after": after}), ["Urgent only", "Home only"])
+        self.assertEqual(self.titles({"due_after": after, "due_before": before}), ["Urgent only"])
+
+    def test_filter_by_any_tag(self):
+        self.assertEqual(self.titles({"tags": "urgent"}), ["Both", "Urgent only"])
+        self.assertEqual(self.titles({"tags": "Urgent,Home"}), ["Both", "Urgent only", "Home only"])
+
+    def test_filter_by_all_tags(self):
+        self.assertEqual(self.titles({"tags": "Urgent,home", "tags_match": "all"}), ["Both"])
+
+    def test_combined_filters(self):
+        self.assertEqual(self.titles({"tags": "Home", "status": "OPEN", "page_size": 1}), ["Both"])
+
+    def test_invalid_filters(self):
+        for params in [
+            {"status": "LATE"},
+            {"due_before": "tomorrow"},
+            {"tags_match": "all"},
+            {"tags": "Home", "tags_match": "some"},
+        ]:
+            response = self.client.get("/api/tasks/", params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn("error", response.data)
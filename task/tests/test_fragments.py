@@ -0,0 +1,68 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from task.models import Task, Tag
+
+
+class TaskFragmentCacheTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        self.tag = Tag.objects.create(name="Sample Tag")
+        self.tasks = []
+        for i in range(5):
+            task = Task.objects.create(title=f"Task {i}", description="Sample description", status="OPEN")
+            task.tags.add(self.tag)
+            self.tasks.append(task)
+
+    def get_titles_and_tags(self):
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(task["title"], task["tags"]) for task in response.data["results"]]
+
+    def version(self, task):
+        return Task.objects.values_list("version", flat=True).get(pk=task.pk)
+
+    def test_warm_list_skips_tag_query(self):
+        # Fragments are written once the request's transaction commits
+        with self.captureOnCommitCallbacks(execute=True):
+            first = self.client.get("/api/tasks/").data
+        # The resource version for the ETag and the page of tasks
+        with self.assertNumQueries(2):
+            second = self.client.get("/api/tasks/").data
+        self.assertEqual(second, first)
+
+    def test_save_bumps_version(self):
+        before = self.version(self.tasks[0])
+        task = Task.objects.get(pk=self.tasks[0].pk)
+        task.title = "Renamed"
+        task.save()
+        self.assertGreater(self.version(task), before)
+        self.get_titles_and_tags()
+        self.assertEqual(self.get_titles_and_tags()[0], ("Renamed", ["Sample Tag"]))
+
+    def test_tag_link_changes_bump_version(self):
+        self.get_titles_and_tags()
+        before = self.version(self.tasks[1])
+        self.tasks[1].tags.add(Tag.objects.create(name="Other"))
+        self.assertGreater(self.version(self.tasks[1]), before)
+        self.assertEqual(self.get_titles_and_tags()[1], ("Task 1", ["Sample Tag", "Other"]))
+        self.tasks[1].tags.clear()
+        self.assertEqual(self.get_titles_and_tags()[1], ("Task 1", []))
+
+    def test_tag_rename_bumps_tasks_using_it(self):
+        self.get_titles_and_tags()
+        self.tag.name = "Renamed Tag"
+        self.tag.save()
+        self.assertEqual({tags[0] for _, tags in self.get_titles_and_tags()}, {"Renamed Tag"})
+
+    def test_bulk_update_bumps_version(self):
+        self.get_titles_and_tags()
+        Task.objects.filter(pk=self.tasks[2].pk).update(title="Bulk")
+        self.assertEqual(self.get_titles_and_tags()[2], ("Bulk", ["Sample Tag"]))
+
+    def test_version_is_not_exposed(self):
+        response = self.client.get(f"/api/tasks/{self.tasks[0].pk}/")
+        self.assertNotIn("version", response.data)
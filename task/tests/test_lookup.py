@@ -0,0 +1,110 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from task.models import Task, Tag
+
+
+class TaskLookupTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        self.tag = Tag.objects.create(name="Sample Tag")
+        self.tasks = [
+            Task.objects.create(title=f"Task {i}", description="Sample description", status="OPEN")
+            for i in range(30)
+        ]
+        for task in self.tasks:
+            task.tags.add(self.tag)
+
+    def ids(self, tasks):
+        return ",".join(str(task.id) for task in tasks)
+
+    def test_get_by_ids(self):
+        wanted = [self.tasks[5], self.tasks[1], self.tasks[3]]
+        response = self.client.get(f"/api/tasks/?ids={self.ids(wanted)}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([task["id"] for task in response.data["results"]], [task.id for task in wanted])
+        self.assertEqual(response.data["results"][0]["tags"], ["Sample Tag"])
+        self.assertEqual(response.data["missing"], [])
+
+    def test_missing_ids_are_reported(self):
+        response = self.client.get(f"/api/tasks/?ids=999998,{self.tasks[0].id},999999,{self.tasks[0].id}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([task["id"] for task in response.data["results"]], [self.tasks[0].id])
+        self.assertEqual(response.data["missing"], [999998, 999999])
+
+    def test_query_count_does_not_grow_with_ids(self):
+        counts = []
+        for wanted in (self.tasks[:2], self.tasks[2:30]):
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(f"/api/tasks/?ids={self.ids(wanted)}")
+            self.assertEqual(len(response.data["results"]), len(wanted))
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_fields(self):
+        response = self.client.get(f"/api/tasks/?ids={self.tasks[0].id}&fields=id,tags")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [{"id": self.tasks[0].id, "tags": ["Sample Tag"]}])
+
+    def test_post_lookup(self):
+        wanted = self.tasks[::3]
+        response = self.client.post(
+            "/api/tasks/lookup/?fields=id,title",
+            {"ids": [task.id for task in wanted] + [999999]},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [{"id": task.id, "title": task.title} for task in wanted])
+        self.assertEqual(response.data["missing"], [999999])
+
+    def test_invalid_lookups(self):
+        for path in (
+            "/api/tasks/?ids=",
+            "/api/tasks/?ids=1,x",
+            "/api/tasks/?ids=1&status=OPEN",
+            "/api/tasks/?ids=1&stream=true",
+            "/api/tasks/?ids=1&fields=nope",
+            "/api/tasks/?ids=1&page_size=1",
+            "/api/tasks/?ids=99999999999999999999999",
+            "/api/tasks/?ids=1.5",
+        ):
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, path)
+            self.assertIn("error", response.data)
+        for body in (
+            [1, 2],
+            {"id": [1]},
+            {"ids": "a,b"},
+            {"ids": []},
+            {"ids": [2**70]},
+            {"ids": [1.9]},
+            {"ids": [True]},
+            {"ids": [None]},
+        ):
+            response = self.client.post("/api/tasks/lookup/", body, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, body)
+
+    @override_settings(TASK_LOOKUP_MAX_IDS=10)
+    def test_id_limit(self):
+        response = self.client.get(f"/api/tasks/?ids={self.ids(self.tasks[:11])}")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data["error"], "At most 10 ids can be looked up in one request.")
+        response = self.client.post("/api/tasks/lookup/", {"ids": list(range(1, 12))}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # Duplicates count once
+        response = self.client.get(f"/api/tasks/?ids={self.ids(self.tasks[:10] * 2)}")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(user=None)
+        response = self.client.get(f"/api/tasks/?ids={self.tasks[0].id}")
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+        response = self.client.post("/api/tasks/lookup/", {"ids": [self.tasks[0].id]}, format="json")
+        self.assertIn(response.status_code, (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
@@ -2,6 +2,8 @@ from django.test import TestCase
 from django.utils import timezone
 from task.models import Tag, Task
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 
 
 class TaskModelTest(TestCase):
@@ -12,6 +14,10 @@ class TaskModelTest(TestCase):
         tag = Tag.objects.create(name="Test Tag")
         self.assertEqual(str(tag), "Test Tag")
 
+    def test_tag_name_unique_ignoring_case(self):
+        with self.assertRaises(IntegrityError):
+            Tag.objects.create(name="sample TAG")
+
     def test_task_str_method(self):
         task = Task(
             title="Test Task",
@@ -50,3 +56,54 @@ class TaskModelTest(TestCase):
         self.assertEqual(saved_task.due_date, task.due_date)
         self.assertEqual(saved_task.status, "OPEN")
         self.assertIn(self.tag, saved_task.tags.all())
+
+
+class TaskSaveTest(TestCase):
+    def setUp(self):
+        self.task = Task.objects.create(title="Test Task", description="Sample description", status="OPEN")
+        Task.objects.filter(pk=self.task.pk).update(
+            due_date=timezone.now().date() - timezone.timedelta(days=1)
+        )
+
+    def test_status_change_is_single_update(self):
+        task = Task.objects.get(pk=self.task.pk)
+        task.status = "DONE"
+        with CaptureQueriesContext(connection) as queries:
+            task.save()
+        self.assertEqual(len(queries), 1)
+        self.assertTrue(queries[0]["sql"].startswith('UPDATE "task_task" SET "status" = '))
+        self.assertNotIn("title", queries[0]["sql"])
+        self.assertEqual(Task.objects.get(pk=task.pk).status, "DONE")
+
+    def test_unchanged_save_skips_query(self):
+        task = Task.objects.get(pk=self.task.pk)
+        with self.assertNumQueries(0):
+            task.save()
+
+    def test_changed_due_date_is_validated(self):
+        task = Task.objects.get(pk=self.task.pk)
+        task.due_date = timezone.now().date() - timezone.timedelta(days=2)
+        with self.assertRaisesMessage(ValidationError, "Due Date cannot be before Timestamp created."):
+            task.save()
+
+    def test_changed_field_is_validated(self):
+        task = Task.objects.get(pk=self.task.pk)
+        task.status = "UNKNOWN"
+        with self.assertRaises(ValidationError):
+            task.save()
+
+    def test_deferred_field_assignment_is_saved(self):
+        task = Task.objects.only("id").get(pk=self.task.pk)
+        task.title = "Renamed"
+        with self.assertNumQueries(1):
+            task.save()
+        self.assertEqual(Task.objects.get(pk=task.pk).title, "Renamed")
+
+    def test_explicit_update_fields(self):
+        task = Task.objects.get(pk=self.task.pk)
+        task.title = "Renamed"
+        task.status = "DONE"
+        task.save(update_fields=["status"])
+        saved = Task.objects.get(pk=task.pk)
+        self.assertEqual((saved.title, saved.status), ("Test Task", "DONE"))
+        self.assertEqual(task.get_changed_fields(), ["title"])
@@ -0,0 +1,60 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+from task.models import Task
+from task.pagination import encode_cursor
+
+
+class TaskCursorPaginationTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        for i in range(5):
+            Task.objects.create(title=f"Task {i}", description="Sample description", status="OPEN")
+
+    def collect_pages(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(task["id"] for task in response.data["results"])
+            url = response.data["next"]
+        return ids
+
+    def test_first_page(self):
+        response = self.client.get("/api/tasks/", {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+
+    def test_walk_all_pages(self):
+        ids = self.collect_pages("/api/tasks/?page_size=2")
+        self.assertEqual(ids, list(Task.objects.order_by("timestamp", "id").values_list("id", flat=True)))
+
+    def test_walk_pages_with_equal_timestamps(self):
+        Task.objects.update(timestamp=timezone.now())
+        ids = self.collect_pages("/api/tasks/?page_size=2")
+        self.assertEqual(ids, sorted(Task.objects.values_list("id", flat=True)))
+
+    def test_last_page_has_no_next(self):
+        response = self.client.get("/api/tasks/", {"page_size": 5})
+        self.assertEqual(len(response.data["results"]), 5)
+        self.assertIsNone(response.data["next"])
+
+    @override_settings(TASK_MAX_PAGE_SIZE=3)
+    def test_page_size_is_capped(self):
+        response = self.client.get("/api/tasks/", {"page_size": 1000})
+        self.assertEqual(len(response.data["results"]), 3)
+
+    def test_invalid_page_size(self):
+        response = self.client.get("/api/tasks/", {"page_size": "zero"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {"error": "page_size must be a positive integer."})
+
+    def test_invalid_cursor(self):
+        for cursor in ["not-a-cursor", encode_cursor({"id": 1}), encode_cursor(["yesterday", 1])]:
+            response = self.client.get("/api/tasks/", {"cursor": cursor})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data, {"error": "Invalid cursor."})
@@ -0,0 +1,124 @@
+import datetime
+import io
+import json
+from decimal import Decimal
+from unittest import mock
+import msgpack
+from rest_framework.test import APITestCase
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase
+from django.utils import timezone
+from task.models import Task
+from task.renderers import FastJSONParser, FastJSONRenderer
+
+
+class FastJSONTestCase(SimpleTestCase):
+    data = [
+        {
+            "id": 1,
+            "timestamp": datetime.datetime(2023, 6, 1, 12, 30, 5, 250000, tzinfo=datetime.timezone.utc),
+            "due_date": datetime.date(2023, 12, 31),
+            "title": "Café  ",
+            "tags": ["Sample Tag"],
+            "price": Decimal("1.50"),
+        }
+    ]
+
+    def test_renders_like_drf(self):
+        self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+
+    def test_fallback_without_orjson(self):
+        with mock.patch("task.renderers.orjson", None):
+            self.assertEqual(FastJSONRenderer().render(self.data), JSONRenderer().render(self.data))
+            body = io.BytesIO(b'{"title": "Caf\xc3\xa9"}')
+            self.assertEqual(FastJSONParser().parse(body), {"title": "Café"})
+
+    def test_indent_is_honoured(self):
+        rendered = FastJSONRenderer().render({"a": 1}, "application/json; indent=2")
+        self.assertEqual(rendered, b'{\n  "a": 1\n}')
+
+    def test_parses_like_drf(self):
+        body = JSONRenderer().render(self.data)
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(body)), JSONParser().parse(io.BytesIO(body)))
+
+    def test_invalid_json_is_rejected(self):
+        for body in [b"{", b"NaN", b'{"a": Infinity}']:
+            with self.assertRaises(ParseError):
+                FastJSONParser().parse(io.BytesIO(body))
+
+    def test_other_charsets_use_drf_parser(self):
+        body = io.BytesIO(json.dumps({"title": "Café"}, ensure_ascii=False).encode("latin-1"))
+        self.assertEqual(
+            FastJSONParser().parse(body, parser_context={"encoding": "latin-1"}), {"title": "Café"}
+        )
+
+
+class FastJSONViewTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+
+    def test_post_and_list_round_trip(self):
+        body = json.dumps({"title": "T", "description": "D", "tags": ["A"], "status": "OPEN"})
+        response = self.client.post("/api/tasks/", body, content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        response = self.client.get("/api/tasks/")
+        self.assertEqual(json.loads(response.content)["results"][0]["tags"], ["A"])
+
+    def test_malformed_body_is_400(self):
+        response = self.client.post("/api/tasks/", "{", content_type="application/json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class MessagePackTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        self.due_date = timezone.now().date() + datetime.timedelta(days=30)
+        for i in range(20):
+            body = json.dumps(
+                {
+                    "title": f"Task {i}",
+                    "description": "D",
+                    "due_date": self.due_date.isoformat(),
+                    "tags": ["A"],
+                    "status": "OPEN",
+                }
+            )
+            self.client.post("/api/tasks/", body, content_type="application/json")
+
+    def test_list_as_msgpack(self):
+        response = self.client.get("/api/tasks/", HTTP_ACCEPT="application/msgpack")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/msgpack")
+        data = msgpack.unpackb(response.content)
+        task = data["results"][0]
+        self.assertEqual(task["tags"], ["A"])
+        self.assertEqual(task["due_date"], (self.due_date - datetime.date(1970, 1, 1)).days)
+        timestamp = Task.objects.get(pk=task["id"]).timestamp
+        self.assertEqual(task["timestamp"], int(round(timestamp.timestamp() * 1000000)))
+        self.assertLess(len(response.content), len(self.client.get("/api/tasks/").content))
+
+    def test_tags_as_msgpack(self):
+        response = self.client.get("/api/tags/", HTTP_ACCEPT="application/msgpack")
+        self.assertEqual([tag["name"] for tag in msgpack.unpackb(response.content)], ["A"])
+
+    def test_post_msgpack(self):
+        due = timezone.now().date() + datetime.timedelta(days=60)
+        due_date = (due - datetime.date(1970, 1, 1)).days
+        body = msgpack.packb({"title": "T", "description": "D", "due_date": due_date, "tags": ["B"]})
+        response = self.client.post(
+            "/api/tasks/", body, content_type="application/msgpack", HTTP_ACCEPT="application/msgpack"
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        data = msgpack.unpackb(response.content)
+        self.assertEqual(data["due_date"], due_date)
+        self.assertEqual(str(Task.objects.get(pk=data["id"]).due_date), due.isoformat())
+
+    def test_malformed_msgpack_is_400(self):
+        response = self.client.post("/api/tasks/", b"\xc1", content_type="application/msgpack")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,63 @@
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from task.models import Task
+
+
+class TaskSearchTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        self.invoice = Task.objects.create(title="Send invoice", description="Invoice for the March order")
+        self.report = Task.objects.create(
+            title="Write report", description="Quarterly report, mention the invoice"
+        )
+        self.garden = Task.objects.create(title="Water plants", description="Garden", status="DONE")
+
+    def search(self, params):
+        response = self.client.get("/api/tasks/", params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task["title"] for task in response.data["results"]]
+
+    def test_ranked_search(self):
+        self.assertEqual(self.search({"q": "invoice"}), ["Send invoice", "Write report"])
+        self.assertEqual(self.search({"q": "INVOICE quarterly"}), ["Write report"])
+        self.assertEqual(self.search({"q": "holiday"}), [])
+
+    def test_index_follows_writes(self):
+        self.garden.title = "Pay invoice"
+        self.garden.save()
+        self.report.delete()
+        Task.objects.filter(id=self.invoice.id).update(description="Bill")
+        self.assertEqual(sorted(self.search({"q": "invoice"})), ["Pay invoice", "Send invoice"])
+        self.assertEqual(self.search({"q": "march"}), [])
+        self.client.post(
+            "/api/tasks/", [{"title": "Invoice again", "description": "d", "tags": []}], format="json"
+        )
+        self.assertIn("Invoice again", self.search({"q": "invoice"}))
+
+    def test_search_with_filters(self):
+        self.garden.title = "Pay invoice"
+        self.garden.save()
+        self.assertEqual(self.search({"q": "invoice", "status": "DONE"}), ["Pay invoice"])
+
+    def test_search_pages(self):
+        for i in range(5):
+            Task.objects.create(title=f"Invoice {i}", description="invoice")
+        titles, url = [], "/api/tasks/?q=invoice&page_size=2"
+        while url:
+            response = self.client.get(url)
+            titles.extend(task["title"] for task in response.data["results"])
+            url = response.data["next"]
+        self.assertEqual(titles, self.search({"q": "invoice", "page_size": 100}))
+        self.assertEqual(len(titles), 7)
+
+    def test_query_syntax_is_escaped(self):
+        for q in ['"invoice', "invoice OR", "title:report", "*", "NEAR("]:
+            response = self.client.get("/api/tasks/", {"q": q})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_empty_query(self):
+        response = self.client.get("/api/tasks/", {"q": " "})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {"error": "q must not be empty."})
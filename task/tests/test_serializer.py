@@ -1,6 +1,10 @@
+from django.db import connection
 from django.test import TestCase
-from task.models import Tag
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import ValidationError
+from task.models import Tag, Task
 from task.serializers import TaskSerializer, CustomTagField
+from task.tags import resolve_tags
 
 
 class TaskSerializerTest(TestCase):
@@ -35,3 +39,79 @@ class TaskSerializerTest(TestCase):
         expected_tags = set(task_data["tags"])
         actual_tags = set(tag for tag in serializer.data["tags"])
         self.assertEqual(expected_tags, actual_tags)
+
+
+class CustomTagFieldTest(TestCase):
+    def setUp(self):
+        self.field = CustomTagField(many=True)
+        self.existing = [Tag.objects.create(name=f"Tag {i}") for i in range(5)]
+
+    def test_resolves_existing_tags_in_one_query(self):
+        names = [tag.name for tag in self.existing]
+        with self.assertNumQueries(1):
+            tags = self.field.to_internal_value(names)
+        self.assertEqual(tags, self.existing)
+
+    def test_creates_missing_tags_in_bulk(self):
+        names = [f"Tag {i}" for i in range(20)]
+        # Lookup, bulk insert of the 15 missing names, re-read of the inserted rows
+        with self.assertNumQueries(3):
+            tags = self.field.to_internal_value(names)
+        self.assertEqual([tag.name for tag in tags], names)
+        self.assertEqual(Tag.objects.count(), 20)
+
+    def test_duplicate_names_collapse(self):
+        tags = self.field.to_internal_value(["New", "Tag 0", "New"])
+        self.assertEqual([tag.name for tag in tags], ["New", "Tag 0"])
+        self.assertEqual(Tag.objects.filter(name="New").count(), 1)
+
+    def test_names_match_ignoring_case(self):
+        with self.assertNumQueries(1):
+            tags = self.field.to_internal_value(["tag 0", "TAG 0", "Tag 1"])
+        self.assertEqual(tags, self.existing[:2])
+
+    def test_invalid_names(self):
+        for data in [[""], [1], ["x" * 101], "Tag 0"]:
+            with self.assertRaises(ValidationError):
+                self.field.to_internal_value(data)
+
+    def test_resolve_tags_returns_mapping(self):
+        tags = resolve_tags(["Tag 1", "Other"])
+        self.assertEqual(tags["Tag 1"], self.existing[1])
+        self.assertEqual(tags["Other"].name, "Other")
+
+
+class TaskSerializerTagWriteTest(TestCase):
+    def setUp(self):
+        self.tags = [Tag.objects.create(name=f"Tag {i}") for i in range(4)]
+        self.task = Task.objects.create(title="Test Task", description="Sample description")
+        self.task.tags.add(*self.tags[:3])
+
+    def statements(self, queries, verb):
+        return [query["sql"] for query in queries if query["sql"].startswith(verb)]
+
+    def test_update_writes_only_tag_difference(self):
+        serializer = TaskSerializer(self.task, data={"tags": ["Tag 1", "Tag 2", "Tag 3"]}, partial=True)
+        self.assertTrue(serializer.is_valid())
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+        self.assertEqual(len(self.statements(queries, "DELETE")), 1)
+        self.assertEqual(len(self.statements(queries, "INSERT")), 1)
+        self.assertEqual(list(self.task.tags.order_by("id")), self.tags[1:])
+
+    def test_update_with_same_tags_writes_nothing(self):
+        serializer = TaskSerializer(self.task, data={"tags": ["Tag 2", "Tag 1", "Tag 0"]}, partial=True)
+        self.assertTrue(serializer.is_valid())
+        with CaptureQueriesContext(connection) as queries:
+            serializer.save()
+        self.assertEqual(self.statements(queries, "DELETE") + self.statements(queries, "INSERT"), [])
+
+    def test_create_attaches_tags_in_one_insert(self):
+        data = {"title": "New", "description": "Sample description", "tags": ["Tag 0", "Tag 1", "Tag 2"]}
+        serializer = TaskSerializer(data=data)
+        self.assertTrue(serializer.is_valid())
+        with CaptureQueriesContext(connection) as queries:
+            task = serializer.save()
+        # One for the task row, one for all of its through rows
+        self.assertEqual(len(self.statements(queries, "INSERT")), 2)
+        self.assertEqual(list(task.tags.order_by("id")), self.tags[:3])
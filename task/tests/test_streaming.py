@@ -0,0 +1,44 @@
+import json
+from rest_framework.test import APITestCase
+from rest_framework import status
+from django.contrib.auth.models import User
+from django.test import override_settings
+from django.utils import timezone
+from task.models import Task, Tag
+
+
+@override_settings(TASK_STREAM_CHUNK_SIZE=3)
+class TaskStreamingTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        tag = Tag.objects.create(name="Sample Tag")
+        for i in range(7):
+            task = Task.objects.create(title=f"Task {i}", description="Sample description", status="OPEN")
+            task.tags.add(tag)
+        # Equal timestamps make the chunk boundaries rely on the id tie-break
+        Task.objects.filter(title__in=["Task 2", "Task 3", "Task 4"]).update(timestamp=timezone.now())
+
+    def read_stream(self, params):
+        response = self.client.get("/api/tasks/", {"stream": "true", **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_stream_matches_paginated_list(self):
+        with self.assertNumQueries(8):
+            streamed = self.read_stream({})
+        listed = self.client.get("/api/tasks/", {"page_size": 100}).json()["results"]
+        self.assertEqual(streamed, listed)
+        self.assertEqual(len(streamed), 7)
+        self.assertEqual(streamed[0]["tags"], ["Sample Tag"])
+
+    def test_stream_with_filters(self):
+        Task.objects.filter(title="Task 5").update(status="DONE")
+        self.assertEqual([t["title"] for t in self.read_stream({"status": "DONE"})], ["Task 5"])
+        self.assertEqual(self.read_stream({"status": "OVERDUE"}), [])
+
+    def test_stream_rejects_search(self):
+        response = self.client.get("/api/tasks/", {"stream": "true", "q": "task"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -142,6 +142,12 @@ class TagAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Tag.objects.count(), 1)
 
+    def test_create_duplicate_tag(self):
+        Tag.objects.create(name="new tag")
+        response = self.client.post("/api/tags/", self.tag_data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Tag.objects.count(), 1)
+
     def test_retrieve_tag(self):
         tag = Tag.objects.create(name="Sample Tag")
         response = self.client.get(f"/api/tags/{tag.id}/")
@@ -194,3 +200,27 @@ class TagAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         expected_error_message = '{"name":["This field is required."]}'
         self.assertIn(expected_error_message, response.content.decode())
+
+
+class TaskQueryCountTestCase(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="testuser", password="testpassword")
+        self.client.force_authenticate(user=self.user)
+        tags = [Tag.objects.create(name=f"Tag {i}") for i in range(3)]
+        for i in range(10):
+            task = Task.objects.create(title=f"Task {i}", description="Sample description", status="OPEN")
+            task.tags.add(*tags[: 3 - i % 3])
+        self.task = task
+
+    def test_list_query_count(self):
+        # The resource version for the ETag, the page of tasks and all of their tags
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/tasks/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), 10)
+
+    def test_retrieve_query_count(self):
+        with self.assertNumQueries(3):
+            response = self.client.get(f"/api/tasks/{self.task.id}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["tags"], ["Tag 0", "Tag 1", "Tag 2"])
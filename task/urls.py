@@ -1,25 +1,49 @@
+from django.conf import settings
 from django.urls import path
+from .asynchronous import as_async_view
 from .views import (
     TaskRetrieveUpdateDestroyAPIView,
+    TaskChangesAPIView,
+    TaskLookupAPIView,
     TagListCreateAPIView,
     TagRetrieveUpdateDestroyAPIView,
+    TokenCreateAPIView,
+    CacheStatsAPIView,
+    BatchAPIView,
 )
 
+
+def as_view(view_class):
+    view = view_class.as_view()
+    # ASGI deployments get coroutine views, see todo/asgi.py
+    return as_async_view(view) if getattr(settings, "TASK_ASYNC_VIEWS", False) else view
+
+
 urlpatterns = [
     # Endpoint for listing and creating tasks
-    path("tasks/", TaskRetrieveUpdateDestroyAPIView.as_view(), name="tasks-list-create"),
+    path("tasks/", as_view(TaskRetrieveUpdateDestroyAPIView), name="tasks-list-create"),
+    # Endpoint for the tasks created, updated or deleted since a cursor
+    path("tasks/changes/", as_view(TaskChangesAPIView), name="task-changes"),
+    # Endpoint for fetching many tasks by id, for lists too long for ?ids=
+    path("tasks/lookup/", as_view(TaskLookupAPIView), name="task-lookup"),
     # Endpoint for retrieving, updating, and deleting a specific task
     path(
         "tasks/<int:pk>/",
-        TaskRetrieveUpdateDestroyAPIView.as_view(),
+        as_view(TaskRetrieveUpdateDestroyAPIView),
         name="task-retrieve",
     ),
     # Endpoint for listing and creating tags
-    path("tags/", TagListCreateAPIView.as_view(), name="tag-list-create"),
+    path("tags/", as_view(TagListCreateAPIView), name="tag-list-create"),
     # Endpoint for retrieving, updating, and deleting a specific tag
     path(
         "tags/<int:pk>/",
-        TagRetrieveUpdateDestroyAPIView.as_view(),
+        as_view(TagRetrieveUpdateDestroyAPIView),
         name="tag-retrieve-update-destroy",
     ),
+    # Endpoint for running several task and tag operations in one request
+    path("batch/", as_view(BatchAPIView), name="batch"),
+    # Endpoint for exchanging Basic credentials for a bearer token
+    path("token/", as_view(TokenCreateAPIView), name="token-create"),
+    # Endpoint for the response cache hit/miss counters
+    path("cache/stats/", as_view(CacheStatsAPIView), name="cache-stats"),
 ]
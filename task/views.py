@@ -1,41 +1,129 @@
 from .models import Task, Tag
-from .serializers import TaskSerializer, TagSerializer
+from .serializers import TaskSerializer, TagSerializer, allowed_fields
+from .pagination import TaskCursorPagination, TaskSearchPagination
+from .filters import LIST_FILTER_PARAMS, FilterError, filter_tasks
+from .streaming import stream_tasks_response
+from .lookup import lookup_tasks_response
+from .versioning import conditional_on
+from .caching import cache_response, cache_stats
+from .fragments import serialize_tasks
+from .fieldsets import get_requested_fields, restrict_queryset
+from .changes import CursorExpired, decode_change_cursor, encode_change_cursor, get_changes
+from .authentication import BearerTokenAuthentication, CachedBasicAuthentication, issue_token
+from .batch import BatchError, get_batch_mode, parse_operations, run_batch
+from .bulk import (
+    BulkError,
+    BulkItemErrors,
+    bulk_create_tasks,
+    bulk_delete_tasks,
+    bulk_update_tasks,
+    check_bulk_size,
+    get_bulk_mode,
+)
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from rest_framework.authentication import BasicAuthentication
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.exceptions import ParseError
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from django.core.exceptions import ValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.utils import timezone
 import ast
 
-allowed_fields = set(["title", "description", "due_date", "tags", "status"])
-
 
 class TaskRetrieveUpdateDestroyAPIView(APIView):
-    allowed_methods = ["GET", "POST", "PUT", "DELETE"]
-    authentication_classes = [BasicAuthentication]
+    allowed_methods = ["GET", "POST", "PUT", "PATCH", "DELETE"]
+    authentication_classes = [CachedBasicAuthentication, BearerTokenAuthentication]
     permission_classes = [IsAuthenticated]
+    pagination_class = TaskCursorPagination
+    search_pagination_class = TaskSearchPagination
 
+    @conditional_on("task")
     def get(self, request, pk=None):
         if pk:
-            try:
-                tasks = Task.objects.get(id=pk)
-                serializer = TaskSerializer(tasks)
+            return self.retrieve(request, pk)
+        return self.list(request)
 
-            except Task.DoesNotExist:
-                return Response(
-                    {"error": f"Task with id = {pk} not found."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
+    @cache_response("task")
+    def retrieve(self, request, pk):
+        try:
+            fields = get_requested_fields(request)
+            tasks = restrict_queryset(Task.objects.all(), fields).get(id=pk)
+            serializer = TaskSerializer(tasks, fields=fields)
 
-        else:
-            tasks = Task.objects.all()
-            serializer = TaskSerializer(tasks, many=True)
+        except ParseError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Task.DoesNotExist:
+            return Response(
+                {"error": f"Task with id = {pk} not found."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         serializer_data = serializer.data
         return Response(serializer_data, status=status.HTTP_200_OK)
 
+    def list(self, request):
+        if "ids" in request.query_params:
+            return self.lookup(request)
+        criteria = {
+            key: request.query_params[key] for key in LIST_FILTER_PARAMS if key in request.query_params
+        }
+        if request.query_params.get("stream") in ("1", "true"):
+            return self.stream(request, criteria)
+
+        if "q" in request.query_params:
+            paginator = self.search_pagination_class()
+        else:
+            paginator = self.pagination_class()
+        try:
+            fields = get_requested_fields(request)
+            # Without ?fields= tags are only loaded for the rows serialize_tasks has no cached fragment of
+            queryset = filter_tasks(Task.objects.all(), criteria)
+            if fields is not None:
+                queryset = restrict_queryset(queryset, fields)
+            tasks = paginator.paginate_queryset(queryset, request, view=self)
+        except (FilterError, ParseError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if fields is not None:
+            return paginator.get_paginated_response(TaskSerializer(tasks, many=True, fields=fields).data)
+        return paginator.get_paginated_response(serialize_tasks(tasks))
+
+    def lookup(self, request):
+        # Specific tasks by id, all of them in one response
+        combined = [
+            key
+            for key in (*LIST_FILTER_PARAMS, "q", "stream", "cursor", "page_size")
+            if key in request.query_params
+        ]
+        if combined:
+            return Response(
+                {"error": f"ids cannot be combined with: {', '.join(combined)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return lookup_tasks_response(request, request.query_params["ids"])
+
+    def stream(self, request, criteria):
+        # The whole filtered list as one JSON array, read and sent in chunks
+        if "q" in request.query_params:
+            return Response(
+                {"error": "stream cannot be combined with q."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        # Django's ASGI handler iterates the response on the event loop, where the chunk queries cannot run
+        if isinstance(request._request, ASGIRequest):
+            return Response(
+                {"error": "stream is not available under ASGI."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            fields = get_requested_fields(request)
+            queryset = restrict_queryset(filter_tasks(Task.objects.all(), criteria), fields)
+        except (FilterError, ParseError) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return stream_tasks_response(queryset, fields)
+
     def post(self, request):
+        if isinstance(request.data, list):
+            return self.bulk_create(request)
+
         #  dictionary not in
         if not set(request.data.keys()).issubset(allowed_fields):
             return Response(
@@ -57,6 +145,15 @@ class TaskRetrieveUpdateDestroyAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+    def bulk_create(self, request):
+        try:
+            mode = get_bulk_mode(request)
+            check_bulk_size(request.data)
+        except BulkError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        results, response_status = bulk_create_tasks(request.data, mode=mode)
+        return Response({"results": results}, status=response_status)
+
     def put(self, request, pk):
         if not set(request.data.keys()).issubset(allowed_fields):
             return Response(
@@ -86,7 +183,29 @@ class TaskRetrieveUpdateDestroyAPIView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-    def delete(self, request, pk):
+    def patch(self, request, pk=None):
+        # PUT on a single task is already a partial update
+        if pk:
+            if not isinstance(request.data, dict):
+                return Response(
+                    {"error": "Request body must be an object."}, status=status.HTTP_400_BAD_REQUEST
+                )
+            return self.put(request, pk)
+        try:
+            updated = bulk_update_tasks(request.data)
+        except BulkError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except BulkItemErrors as e:
+            return Response({"errors": e.errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
+
+    def delete(self, request, pk=None):
+        if not pk:
+            try:
+                deleted = bulk_delete_tasks(request.data)
+            except BulkError as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+            return Response({"deleted": deleted}, status=status.HTTP_200_OK)
         try:
             task = Task.objects.get(id=pk)
             task.delete()
@@ -98,10 +217,53 @@ class TaskRetrieveUpdateDestroyAPIView(APIView):
             )
 
 
+class TaskChangesAPIView(APIView):
+    # Tasks created, changed or deleted since a cursor, for clients that keep a local copy
+    authentication_classes = [CachedBasicAuthentication, BearerTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    pagination_class = TaskCursorPagination
+
+    def get(self, request):
+        try:
+            since = request.query_params.get("since")
+            position = decode_change_cursor(since) if since else None
+            page_size = self.pagination_class().get_page_size(request)
+        except ParseError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except CursorExpired as e:
+            return Response({"error": str(e)}, status=status.HTTP_410_GONE)
+        issued = timezone.now()
+        tasks, deleted, next_position, has_more = get_changes(position, page_size)
+        return Response(
+            {
+                "results": serialize_tasks(tasks),
+                "deleted": deleted,
+                "cursor": encode_change_cursor(*next_position, issued),
+                "has_more": has_more,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class TaskLookupAPIView(APIView):
+    # Same as GET /api/tasks/?ids=, for id lists too long for a query string
+    authentication_classes = [CachedBasicAuthentication, BearerTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        if not isinstance(request.data, dict) or "ids" not in request.data:
+            return Response(
+                {"error": "Request body must be an object with ids."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        return lookup_tasks_response(request, request.data["ids"])
+
+
 class TagListCreateAPIView(APIView):
-    authentication_classes = [BasicAuthentication]
+    authentication_classes = [CachedBasicAuthentication, BearerTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
+    @conditional_on("tag")
+    @cache_response("tag")
     def get(self, request):
         tags = Tag.objects.all()
         serializer = TagSerializer(tags, many=True)
@@ -116,7 +278,7 @@ class TagListCreateAPIView(APIView):
 
 
 class TagRetrieveUpdateDestroyAPIView(APIView):
-    authentication_classes = [BasicAuthentication]
+    authentication_classes = [CachedBasicAuthentication, BearerTokenAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get_object(self, pk):
@@ -125,6 +287,8 @@ class TagRetrieveUpdateDestroyAPIView(APIView):
         except Tag.DoesNotExist:
             return None
 
+    @conditional_on("tag")
+    @cache_response("tag")
     def get(self, request, pk):
         tag = self.get_object(pk)
         if tag:
@@ -157,3 +321,44 @@ class TagRetrieveUpdateDestroyAPIView(APIView):
             {"error": f"Tag with id = {pk} not found."},
             status=status.HTTP_400_BAD_REQUEST,
         )
+
+
+class BatchAPIView(APIView):
+    # Runs a list of task and tag operations in one request, authenticated once
+    authentication_classes = [CachedBasicAuthentication, BearerTokenAuthentication]
+    permission_classes = [IsAuthenticated]
+    batch_views = (
+        TaskRetrieveUpdateDestroyAPIView,
+        TaskChangesAPIView,
+        TaskLookupAPIView,
+        TagListCreateAPIView,
+        TagRetrieveUpdateDestroyAPIView,
+    )
+
+    def post(self, request):
+        try:
+            mode = get_batch_mode(request)
+            operations = parse_operations(request.data, self.batch_views, mode)
+        except BatchError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        results, response_status = run_batch(request, operations, mode=mode)
+        return Response({"results": results}, status=response_status)
+
+
+class TokenCreateAPIView(APIView):
+    # Exchanges Basic credentials for a bearer token, the only place tokens are issued
+    authentication_classes = [CachedBasicAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        token, expires_in = issue_token(request.user)
+        return Response({"token": token, "expires_in": expires_in}, status=status.HTTP_201_CREATED)
+
+
+class CacheStatsAPIView(APIView):
+    # Response cache counters of the serving process
+    authentication_classes = [CachedBasicAuthentication]
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(cache_stats(), status=status.HTTP_200_OK)
@@ -12,5 +12,18 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "todo.settings")
+os.environ.setdefault("TASK_ASYNC_VIEWS", "1")
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported once the app registry is ready
+from task.events import EVENTS_PATH, events_application  # noqa: E402
+
+
+async def application(scope, receive, send):
+    # The Server-Sent Events feed stays open indefinitely, so it is served by a
+    # plain ASGI app instead of a Django view holding a worker thread per client
+    if scope["type"] == "http" and scope["path"] == EVENTS_PATH:
+        await events_application(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
@@ -44,6 +44,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Compresses response bodies, so it sits above everything that reads or writes them
+    "task.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -92,7 +94,79 @@ DATABASES = {
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.BasicAuthentication",
-    ]
+    ],
+    # orjson backed JSON, falling back to the stdlib json module when orjson is missing,
+    # and MessagePack for clients asking for application/msgpack
+    "DEFAULT_RENDERER_CLASSES": [
+        "task.renderers.FastJSONRenderer",
+        "task.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "task.renderers.FastJSONParser",
+        "task.renderers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+}
+
+# Verified Basic credentials are remembered this many seconds by the task API
+TASK_AUTH_CACHE_TTL = 60
+TASK_AUTH_CACHE_SIZE = 1024
+# Lifetime in seconds of bearer tokens issued by /api/token/
+TASK_TOKEN_TTL = 900
+
+# Cache alias and lifetime in seconds of cached task and tag GET responses
+TASK_RESPONSE_CACHE = "default"
+TASK_RESPONSE_CACHE_TIMEOUT = 300
+# Lifetime in seconds of cached task representations used by the task list
+TASK_FRAGMENT_CACHE_TIMEOUT = 3600
+
+# Responses smaller than this many bytes are sent uncompressed; levels per content coding
+TASK_COMPRESSION_MIN_SIZE = 1024
+TASK_COMPRESSION_LEVELS = {"zstd": 3, "br": 4, "gzip": 6}
+
+# Days deleted tasks are remembered for /api/tasks/changes/; older cursors must resync
+TASK_TOMBSTONE_RETENTION_DAYS = 30
+
+# Server-Sent Events feed at /api/events/ (ASGI only): seconds between change polls,
+# events kept for Last-Event-ID, events a slow client may fall behind, keep-alive seconds
+TASK_EVENTS_POLL_INTERVAL = 1.0
+TASK_EVENTS_BUFFER_SIZE = 1000
+TASK_EVENTS_QUEUE_SIZE = 100
+TASK_EVENTS_KEEPALIVE = 15
+
+# Serve the API through coroutine views running on a thread pool of this size;
+# todo/asgi.py turns this on, WSGI servers keep plain synchronous views
+TASK_ASYNC_VIEWS = os.environ.get("TASK_ASYNC_VIEWS") == "1"
+TASK_ASYNC_VIEW_THREADS = 32
+
+# Task list pagination: default page size and the hard cap for ?page_size=
+TASK_PAGE_SIZE = 100
+TASK_MAX_PAGE_SIZE = 1000
+# Rows fetched per query by ?stream=true task list responses
+TASK_STREAM_CHUNK_SIZE = 500
+
+# Most ids one GET /api/tasks/?ids= or POST /api/tasks/lookup/ request can ask for
+TASK_LOOKUP_MAX_IDS = 500
+
+# Largest list accepted by the bulk task endpoints
+TASK_BULK_MAX_ITEMS = 1000
+# Rows written per statement by bulk updates and deletes
+TASK_BULK_CHUNK_SIZE = 500
+
+# Maximum number of operations accepted by one /api/batch/ request
+TASK_BATCH_MAX_OPERATIONS = 100
+
+# Caches
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+# Per-process local memory; point TASK_RESPONSE_CACHE at a shared backend
+# (file based, memcached, redis) to share cached responses between workers.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
 }
 
 # Password validation